@@ -0,0 +1,497 @@
+"""
+Versions vectorisées (NumPy) des fonctions de distorsion.
+
+Chaque fonction applique une distorsion à toute la grille en une seule passe :
+elle reçoit les coordonnées de base sous forme de tableaux (xs, ys) et les
+paramètres par cellule en structure de tableaux (dict de ndarrays, voir
+DistortionEngine.generate_distortion_params_batch), et retourne les tableaux
+(x, y, rotation). Les calculs reproduisent ceux des fonctions
+DistortionEngine.apply_distortion_* (valeurs par défaut des paramètres).
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from distorsion_movement.enums import DistortionType
+
+
+def _center_floor(canvas_size: Tuple[int, int]) -> Tuple[float, float]:
+    """Centre du canvas tel que calculé par les distorsions historiques (division entière)."""
+    return canvas_size[0] // 2, canvas_size[1] // 2
+
+
+def _center_half(canvas_size: Tuple[int, int]) -> Tuple[float, float]:
+    """Centre du canvas tel que calculé par les distorsions récentes (x 0.5)."""
+    return canvas_size[0] * 0.5, canvas_size[1] * 0.5
+
+
+def _polar(xs, ys, cx, cy):
+    """
+    Retourne (dx, dy, r, r_safe, at_center) relatifs au centre (cx, cy).
+
+    r_safe remplace les rayons nuls par 1 pour éviter les divisions par zéro ;
+    at_center indique les cellules exactement au centre (singularité).
+    """
+    dx = xs - cx
+    dy = ys - cy
+    r = np.hypot(dx, dy)
+    at_center = r == 0
+    r_safe = np.where(at_center, 1.0, r)
+    return dx, dy, r, r_safe, at_center
+
+
+def _pseudo_noise(px, py, t, k=1.3):
+    """Bruit pseudo-Perlin à base de sin/cos, identique à celui des distorsions scalaires."""
+    return np.sin(px) * np.cos(py * k) + np.sin(px * 0.7 + t) * np.cos(py * 0.9 - t * 1.1)
+
+
+def random(xs, ys, params, cell_size, strength, time, canvas_size):
+    max_offset = cell_size * strength
+    new_x = xs + params['offset_x'] * max_offset
+    new_y = ys + params['offset_y'] * max_offset
+    rotation = params['rotation_phase'] * strength * 0.2
+    return new_x, new_y, rotation
+
+
+def sine(xs, ys, params, cell_size, strength, time, canvas_size):
+    max_offset = cell_size * strength
+    phase = time * params['frequency']
+    new_x = xs + np.sin(phase + params['phase_x']) * max_offset
+    new_y = ys + np.cos(phase + params['phase_y']) * max_offset
+    rotation = np.sin(time + params['rotation_phase']) * strength * 0.3
+    return new_x, new_y, rotation
+
+
+def perlin(xs, ys, params, cell_size, strength, time, canvas_size):
+    max_offset = cell_size * strength
+    noise_x = np.sin(xs * 0.01 + time) + np.sin(xs * 0.03 + time * 0.5) * 0.5
+    noise_y = np.cos(ys * 0.01 + time) + np.cos(ys * 0.03 + time * 0.5) * 0.5
+    new_x = xs + noise_x * max_offset * 0.5
+    new_y = ys + noise_y * max_offset * 0.5
+    rotation = noise_x * strength * 0.2
+    return new_x, new_y, rotation
+
+
+def circular(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_floor(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+
+    wave = np.sin(r * 0.02 - time * 2) * strength
+    wave[at_center] = 0.0
+    max_offset = cell_size * wave
+    new_x = xs + (dx / r_safe) * max_offset
+    new_y = ys + (dy / r_safe) * max_offset
+    return new_x, new_y, wave * 0.5
+
+
+def swirl(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_floor(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+    max_distance = math.sqrt(cx**2 + cy**2)
+
+    wave_phase = r * 0.02 - time * 3.0
+    amplitude = math.sin(time * 4.0) * np.sin(wave_phase)
+    amplitude *= np.exp(-(r / max_distance) * 2.0)
+    amplitude[at_center] = 0.0
+
+    displacement = amplitude * (cell_size * strength)
+    new_x = xs + (-dy / r_safe) * displacement
+    new_y = ys + (dx / r_safe) * displacement
+    rotation = amplitude * strength * 3.0 * 0.5
+    return new_x, new_y, rotation
+
+
+def ripple(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_floor(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+    max_distance = math.sqrt(cx**2 + cy**2)
+
+    ripple_phase = r * 0.03 - time * 2.5
+    attenuation = np.exp(-(r / max_distance) * 1.5)
+    amplitude = np.sin(ripple_phase) * 0.8 * attenuation
+    amplitude[at_center] = 0.0
+
+    displacement = amplitude * (cell_size * strength)
+    new_x = xs + (-dy / r_safe) * displacement
+    new_y = ys + (dx / r_safe) * displacement
+    rotation = amplitude * strength * 0.3
+    return new_x, new_y, rotation
+
+
+def flow(xs, ys, params, cell_size, strength, time, canvas_size):
+    flow_x = np.zeros_like(xs)
+    flow_y = np.zeros_like(ys)
+    delta = 0.01
+
+    for octave in range(3):
+        freq = 0.01 * (2 ** octave)
+        amplitude = 1.0 / (2 ** octave)
+        fx = xs * freq + time * 0.5 * (octave + 1)
+        fy = ys * freq + time * 0.5 * (octave + 1) * 0.7
+
+        potential_a = np.sin(fx) * np.cos(fy * 1.3) + np.sin(fx * 0.7) * np.cos(fy)
+        potential_b = np.cos(fx * 1.1) * np.sin(fy * 0.9) + np.cos(fx) * np.sin(fy * 1.2)
+
+        da_dx = (np.sin(fx + delta) * np.cos(fy * 1.3) + np.sin((fx + delta) * 0.7) * np.cos(fy) - potential_a) / delta
+        da_dy = (np.sin(fx) * np.cos((fy + delta) * 1.3) + np.sin(fx * 0.7) * np.cos(fy + delta) - potential_a) / delta
+        db_dx = (np.cos((fx + delta) * 1.1) * np.sin(fy * 0.9) + np.cos(fx + delta) * np.sin(fy * 1.2) - potential_b) / delta
+        db_dy = (np.cos(fx * 1.1) * np.sin((fy + delta) * 0.9) + np.cos(fx) * np.sin((fy + delta) * 1.2) - potential_b) / delta
+
+        flow_x += (db_dx - da_dy) * amplitude
+        flow_y += (da_dx - db_dy) * amplitude
+
+    magnitude = np.hypot(flow_x, flow_y)
+    normalized = np.tanh(magnitude)
+    scale = np.where(magnitude > 0, normalized / np.where(magnitude > 0, magnitude, 1.0), 0.0)
+    max_offset = cell_size * strength
+    new_x = xs + flow_x * scale * max_offset
+    new_y = ys + flow_y * scale * max_offset
+    rotation = normalized * strength * 0.4
+    return new_x, new_y, rotation
+
+
+def pulse(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_floor(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+
+    pulse_wave = np.sin(time * 1.2 * 2 * math.pi + r * 0.04 + params['phase_offset'])
+    pulse_wave[at_center] = 0.0
+    pulse_factor = 1.0 + (pulse_wave * 0.4 * strength * 0.05)
+    new_x = np.where(at_center, xs, cx + dx * pulse_factor)
+    new_y = np.where(at_center, ys, cy + dy * pulse_factor)
+    rotation = pulse_wave * strength * 0.1
+    return new_x, new_y, rotation
+
+
+def _checker_polarity(xs, ys, cell_size):
+    """+1 pour les cases paires du damier, -1 pour les impaires."""
+    parity = (np.floor_divide(xs, cell_size) + np.floor_divide(ys, cell_size)) % 2
+    return np.where(parity == 0, 1.0, -1.0)
+
+
+def checkerboard(xs, ys, params, cell_size, strength, time, canvas_size):
+    direction = _checker_polarity(xs, ys, cell_size)
+    wave = math.sin(time * 0.8 * 2 * math.pi)
+    new_x = xs + wave * (cell_size * 0.4 * strength) * direction
+    rotation = direction * wave * strength * 0.15
+    return new_x, ys, rotation
+
+
+def checkerboard_diagonal(xs, ys, params, cell_size, strength, time, canvas_size):
+    polarity = _checker_polarity(xs, ys, cell_size)
+    unit = 1 / math.sqrt(2)
+    s = np.sin(2 * math.pi * 0.6 * time + params['phase_offset'])
+    offset = s * (cell_size * 0.35 * strength) * polarity
+    new_x = xs + unit * offset
+    new_y = ys + unit * offset
+    rotation = s * polarity * strength * 0.12
+    return new_x, new_y, rotation
+
+
+def tornado(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_half(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+
+    normalized_r = r / (max(canvas_size) * 0.5)
+    angular_speed = 0.6 + 3.0 * (1.0 - normalized_r)
+    swirl_phase = np.sin(angular_speed * time * 2 * math.pi)
+    swirl_phase[at_center] = 0.0
+
+    swirl_disp = swirl_phase * (cell_size * 0.45 * strength) * (1.0 - normalized_r * 0.7)
+    inward_disp = 0.15 * strength * (1.0 - normalized_r) * cell_size
+    inward_disp = np.where(at_center, 0.0, inward_disp)
+    ux = dx / r_safe
+    uy = dy / r_safe
+    new_x = xs - uy * swirl_disp - ux * inward_disp
+    new_y = ys + ux * swirl_disp - uy * inward_disp
+    rotation = swirl_phase * strength * (0.3 + 0.4 * (1.0 - normalized_r))
+    return new_x, new_y, rotation
+
+
+def spiral(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_half(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+
+    angle_offset = 0.25 * time * 2 * math.pi
+    new_angle = np.arctan2(dy, dx) + angle_offset
+    radius_offset = np.sin(time * 0.08 * 2 * math.pi + r * 0.01) * (cell_size * 0.35 * strength)
+    new_r = r + radius_offset
+    new_x = np.where(at_center, xs, cx + np.cos(new_angle) * new_r)
+    new_y = np.where(at_center, ys, cy + np.sin(new_angle) * new_r)
+    rotation = np.where(at_center, 0.0, angle_offset * 0.15)
+    return new_x, new_y, rotation
+
+
+def shear(xs, ys, params, cell_size, strength, time, canvas_size):
+    max_shear = cell_size * 0.5 * strength
+    shear_offset = np.sin(ys * 0.02 + time * 2 * math.pi * 0.5 + params['phase_offset']) * max_shear
+    rotation = shear_offset / cell_size * 0.15
+    return xs + shear_offset, ys, rotation
+
+
+def lens(xs, ys, params, cell_size, strength, time, canvas_size):
+    w, h = canvas_size
+
+    cols = max(1, int(round(w / max(1, cell_size))))
+    rows = max(1, int(round(h / max(1, cell_size))))
+    min_dim_cells = min(cols, rows)
+    lens_radius_cells = max(1, int(0.15 * min_dim_cells))
+    lens_radius_cells = max(2, min(lens_radius_cells, max(3, min_dim_cells // 3)))
+    lens_radius = lens_radius_cells * cell_size
+
+    margin = lens_radius + 2 * cell_size
+    focus_path_radius = max(0.0, min(w, h) * 0.5 - margin)
+    focus_x = w / 2 + math.cos(time * 2 * math.pi * 0.1) * focus_path_radius
+    focus_y = h / 2 + math.sin(time * 2 * math.pi * 0.1) * focus_path_radius
+
+    dx = xs - focus_x
+    dy = ys - focus_y
+    dist = np.hypot(dx, dy)
+    inside = dist < lens_radius
+
+    t = dist / max(1e-6, lens_radius)
+    falloff = 1 - (t ** (1 + 0.2 * 2))
+    magnification = 1 + 0.5 * strength * falloff
+    new_x = np.where(inside, focus_x + dx * magnification, xs)
+    new_y = np.where(inside, focus_y + dy * magnification, ys)
+    rotation = np.where(inside, (1 - dist / lens_radius) * strength * 0.2, 0.0)
+    return new_x, new_y, rotation
+
+
+def spiral_wave(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_half(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+    ux = dx / r_safe
+    uy = dy / r_safe
+
+    falloff = 1 - r / (max(canvas_size) * 0.5)
+    ripple_offset = np.sin(r * 0.05 - time * 4.0) * (cell_size * 0.4 * strength) * falloff
+    swirl_angle = 0.8 * time * 2 * math.pi
+    swirl_offset = np.sin(swirl_angle + r * 0.01) * (cell_size * 0.25 * strength) * falloff
+    ripple_offset[at_center] = 0.0
+    swirl_offset[at_center] = 0.0
+
+    new_x = xs + ux * ripple_offset - uy * swirl_offset
+    new_y = ys + uy * ripple_offset + ux * swirl_offset
+    rotation = (ripple_offset / cell_size + swirl_offset / cell_size) * 0.15
+    return new_x, new_y, rotation
+
+
+def noise_rotation(xs, ys, params, cell_size, strength, time, canvas_size):
+    phase = params['phase_offset']
+
+    n = np.zeros_like(xs)
+    for fmul, amp in ((1.0, 0.60), (2.0, 0.28), (4.0, 0.12)):
+        fx = xs * 0.2 * fmul + time * 2 * (0.9 + 0.2 * fmul)
+        fy = ys * 0.2 * fmul + time * 2 * (0.7 + 0.15 * fmul)
+        n += np.sin(fx + phase) * np.cos(fy * 1.27 - phase) * amp
+
+    rotation = n * ((math.pi / 3.0) * (0.25 + 0.75 * strength))
+    return xs, ys, rotation
+
+
+def curl_warp(xs, ys, params, cell_size, strength, time, canvas_size):
+    px = (xs + params['offset_x']) * 0.015
+    py = (ys + params['offset_y']) * 0.015
+    tt = time * 0.6
+    eps = 0.001
+
+    dn1_dy = (_pseudo_noise(px, py + eps, tt) - _pseudo_noise(px, py - eps, tt)) / (2 * eps)
+    dn1_dx = (_pseudo_noise(px + eps, py, tt) - _pseudo_noise(px - eps, py, tt)) / (2 * eps)
+    qx = px + 5.2
+    qy = py - 3.7
+    tt2 = tt + 2.5
+    dn2_dy = (_pseudo_noise(qx, qy + eps, tt2) - _pseudo_noise(qx, qy - eps, tt2)) / (2 * eps)
+    dn2_dx = (_pseudo_noise(qx + eps, qy, tt2) - _pseudo_noise(qx - eps, qy, tt2)) / (2 * eps)
+
+    curl_x = dn2_dx - dn1_dy
+    curl_y = dn1_dx - dn2_dy
+    mag = np.hypot(curl_x, curl_y)
+    inv = np.where(mag > 0, 1.0 / np.where(mag > 0, mag, 1.0), 1.0)
+
+    max_offset = cell_size * 0.45 * strength
+    new_x = xs + curl_x * inv * max_offset
+    new_y = ys + curl_y * inv * max_offset
+    rotation = mag * strength * 0.4
+    return new_x, new_y, rotation
+
+
+def fractal_noise(xs, ys, params, cell_size, strength, time, canvas_size):
+    sx = xs + params['offset_x']
+    sy = ys + params['offset_y']
+
+    disp_x = np.zeros_like(xs)
+    disp_y = np.zeros_like(ys)
+    amplitude = 1.0
+    freq_mul = 1.0
+    max_amp_sum = 0.0
+    for _ in range(4):
+        px = sx * 0.012 * freq_mul
+        py = sy * 0.012 * freq_mul
+        t = time * 0.4 * freq_mul
+        disp_x += _pseudo_noise(px, py, t) * amplitude
+        disp_y += _pseudo_noise(py + 5.2, px - 3.7, t + 1.5) * amplitude
+        max_amp_sum += amplitude
+        amplitude *= 0.5
+        freq_mul *= 2.0
+
+    disp_x /= max_amp_sum
+    disp_y /= max_amp_sum
+    max_offset = cell_size * 0.45 * strength
+    new_x = xs + disp_x * max_offset
+    new_y = ys + disp_y * max_offset
+    rotation = (disp_x + disp_y) * 0.15 * strength
+    return new_x, new_y, rotation
+
+
+def moire(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_half(canvas_size)
+    dx = xs - cx
+    dy = ys - cy
+    phase0 = params['phase_offset']
+
+    wavelength_px = 90.0
+    k1 = 2 * math.pi / wavelength_px
+    k2 = 2 * math.pi / (wavelength_px * (1.0 + 0.06))
+    a1 = math.radians(25.0)
+    a2 = math.radians(25.0 + 8.0)
+    u1 = (math.cos(a1), math.sin(a1))
+    u2 = (math.cos(a2), math.sin(a2))
+
+    tphase = 2 * math.pi * 0.15 * time
+    s1 = np.sin(k1 * (dx * u1[0] + dy * u1[1]) + tphase + 0.7 * phase0)
+    s2 = np.sin(k2 * (dx * u2[0] + dy * u2[1]) - tphase + 1.1 * phase0)
+
+    env_vec_x = k1 * u1[0] - k2 * u2[0]
+    env_vec_y = k1 * u1[1] - k2 * u2[1]
+    env_norm = max(math.hypot(env_vec_x, env_vec_y), 1e-6)
+    env_proj = dx * (env_vec_x / env_norm) + dy * (env_vec_y / env_norm)
+    envelope = 0.5 + 0.5 * np.sin(env_norm * env_proj + 0.6 * tphase + phase0)
+
+    disp_x = (s1 * u1[0] + s2 * u2[0]) * envelope
+    disp_y = (s1 * u1[1] + s2 * u2[1]) * envelope
+    mag = np.hypot(disp_x, disp_y)
+    inv = np.where(mag > 1e-6, 1.0 / np.where(mag > 1e-6, mag, 1.0), 1.0)
+
+    max_offset = cell_size * 0.6 * strength
+    new_x = xs + disp_x * inv * max_offset
+    new_y = ys + disp_y * inv * max_offset
+    rotation = envelope * 0.12 * strength * (s1 - s2)
+    return new_x, new_y, rotation
+
+
+def _melt_noise(base_x, base_y, params, noise_scale, tt, weights, time_muls, t_offset):
+    """Bruit multi-octaves de « fonte » partagé par kaleidoscope_twist et hypno_spiral_pulse."""
+    px = (base_x + params['noise_ox']) * noise_scale
+    py = (base_y + params['noise_oy']) * noise_scale
+    nx = np.zeros_like(px)
+    ny = np.zeros_like(py)
+    for octave, (weight, time_mul) in enumerate(zip(weights, time_muls)):
+        scale = 2.0 ** octave
+        t = tt * time_mul
+        if octave == 0:
+            nx += _pseudo_noise(px, py, t, 1.31) * weight
+            ny += _pseudo_noise(py + 5.2, px - 3.7, t + t_offset, 1.31) * weight
+        else:
+            nx += _pseudo_noise(px * scale, py * scale, t, 1.31) * weight
+            ny += _pseudo_noise(py * scale + 5.2, px * scale - 3.7, t, 1.31) * weight
+    mag = np.hypot(nx, ny)
+    inv = np.where(mag > 1e-6, 1.0 / np.where(mag > 1e-6, mag, 1.0), 1.0)
+    return nx * inv, ny * inv, mag
+
+
+def kaleidoscope_twist(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_half(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+
+    theta = np.arctan2(dy, dx)
+    theta = np.where(theta < 0, theta + 2 * math.pi, theta)
+
+    sectors = 10
+    sector_angle = 2 * math.pi / sectors
+    sector_idx = np.floor_divide(theta, sector_angle)
+    angle_in_sector = theta - sector_idx * sector_angle
+    angle_in_sector = np.where(sector_idx % 2 == 1, sector_angle - angle_in_sector, angle_in_sector)
+
+    spin = 2 * math.pi * 0.10 * time
+    radial = np.minimum(1.0, r / (math.hypot(cx, cy) + 1e-6))
+    twist = 1.0 * strength * radial
+    new_theta = sector_idx * sector_angle + angle_in_sector + spin + twist
+    base_x = cx + np.cos(new_theta) * r
+    base_y = cy + np.sin(new_theta) * r
+
+    nx, ny, mag = _melt_noise(base_x, base_y, params, 0.02, time * 0.35,
+                              (0.6, 0.28, 0.12), (1.0, 1.7, 2.6), 1.5)
+    max_offset = cell_size * 0.34 * strength * 0.35
+    new_x = np.where(at_center, xs, base_x + nx * max_offset)
+    new_y = np.where(at_center, ys, base_y + ny * max_offset)
+    rotation = np.where(at_center, 0.0, (spin * 0.12 + twist * 0.2) + (mag * 0.1 * strength))
+    return new_x, new_y, rotation
+
+
+def hypno_spiral_pulse(xs, ys, params, cell_size, strength, time, canvas_size):
+    cx, cy = _center_half(canvas_size)
+    dx, dy, r, r_safe, at_center = _polar(xs, ys, cx, cy)
+
+    theta = np.arctan2(dy, dx)
+    theta = np.where(theta < 0, theta + 2 * math.pi, theta)
+
+    radial = np.minimum(1.0, r / (math.hypot(cx, cy) + 1e-6))
+    twist = 1.05 * strength * radial
+    phase = 2 * math.pi * 0.6 * time
+    spin = (2 * math.pi * 0.18) * math.sin(phase) * strength
+    pulse_env = 0.5 * (1.0 - math.cos(phase))
+    angle_pulse = 0.85 * strength * (radial ** 0.85) * pulse_env
+
+    new_theta = theta + twist + spin + angle_pulse
+    base_x = cx + np.cos(new_theta) * r
+    base_y = cy + np.sin(new_theta) * r
+
+    nx, ny, _ = _melt_noise(base_x, base_y, params, 0.02, time * 0.25,
+                            (0.7, 0.25, 0.08), (1.0, 1.7, 2.5), 1.3)
+    max_offset = cell_size * 0.30 * 0.12 * strength
+    new_x = np.where(at_center, xs, base_x + nx * max_offset)
+    new_y = np.where(at_center, ys, base_y + ny * max_offset)
+    rotation = (
+        0.18 * twist
+        + 0.14 * (2 * math.pi * 0.18) * math.cos(phase) * strength
+        + 0.12 * angle_pulse
+    )
+    rotation = np.where(at_center, 0.0, rotation)
+    return new_x, new_y, rotation
+
+
+# Registre des distorsions vectorisées
+BATCH_DISTORTION_REGISTRY = {
+    DistortionType.RANDOM.value: random,
+    DistortionType.SINE.value: sine,
+    DistortionType.PERLIN.value: perlin,
+    DistortionType.CIRCULAR.value: circular,
+    DistortionType.SWIRL.value: swirl,
+    DistortionType.RIPPLE.value: ripple,
+    DistortionType.FLOW.value: flow,
+    DistortionType.PULSE.value: pulse,
+    DistortionType.CHECKERBOARD.value: checkerboard,
+    DistortionType.CHECKERBOARD_DIAGONAL.value: checkerboard_diagonal,
+    DistortionType.TORNADO.value: tornado,
+    DistortionType.SPIRAL.value: spiral,
+    DistortionType.SHEAR.value: shear,
+    DistortionType.LENS.value: lens,
+    DistortionType.SPIRAL_WAVE.value: spiral_wave,
+    DistortionType.NOISE_ROTATION.value: noise_rotation,
+    DistortionType.CURL_WARP.value: curl_warp,
+    DistortionType.FRACTAL_NOISE.value: fractal_noise,
+    DistortionType.MOIRE.value: moire,
+    DistortionType.KALEIDOSCOPE_TWIST.value: kaleidoscope_twist,
+    DistortionType.HYPNO_SPIRAL_PULSE.value: hypno_spiral_pulse,
+}
+
+
+def get_batch_distortion_function(distortion_fn: str):
+    """
+    Retourne la fonction vectorisée pour un type de distorsion.
+    Les types inconnus retombent sur la distorsion aléatoire.
+    """
+    return BATCH_DISTORTION_REGISTRY.get(distortion_fn, random)
@@ -0,0 +1,44 @@
+"""
+Noyau Numba pour l'animation des couleurs.
+
+Le pulse de luminosité de ColorGenerator.get_animated_color est appliqué à
+toute la grille en une boucle compilée et parallélisée (prange). Numba est
+optionnel : si le module n'est pas installé, NUMBA_AVAILABLE vaut False et
+ColorGenerator utilise une version NumPy équivalente.
+"""
+
+import math
+
+import numpy as np
+
+from distorsion_movement.distortion_kernels import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(parallel=True, cache=True)
+def animate_colors(base_rgb, out_rgb, time):
+    """
+    Écrit dans out_rgb (N, 3) uint8 les couleurs de base_rgb modulées par le pulse.
+
+    Pas de fastmath : les couleurs doivent rester identiques, à l'unité près,
+    à celles de ColorGenerator.get_animated_color.
+    """
+    n = base_rgb.shape[0]
+    for i in prange(n):
+        pulse = math.sin(time * 2 + i * 0.1) * 0.2 + 1.0
+        pulse = max(0.5, min(1.5, pulse))
+        for channel in range(3):
+            value = base_rgb[i, channel] * pulse
+            out_rgb[i, channel] = 255 if value > 255 else int(value)
+
+
+def warm_up():
+    """
+    Compile animate_colors (ou le charge du cache disque) sur une seule
+    couleur, pour que la première frame ne paie pas la compilation.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    base_rgb = np.zeros((1, 3), dtype=np.uint8)
+    # Les couleurs de base en cache dans ColorGenerator sont en lecture seule
+    base_rgb.setflags(write=False)
+    animate_colors(base_rgb, np.empty((1, 3), dtype=np.uint8), 0.0)
@@ -5,6 +5,11 @@ Ce package contient tous les générateurs de couleurs pour différents schémas
 utilisés dans le système de grilles déformées.
 """
 
+import functools
+
+import numpy as np
+
+from distorsion_movement import color_kernels
 from .base_color import BaseColor
 from .monochrome import Monochrome
 from .black_white_radial import BlackWhiteRadial
@@ -60,6 +65,34 @@ COLOR_SCHEME_REGISTRY = {
     "candy_shop": CandyShop.get_color_for_position,
 }
 
+# Versions vectorisées (toute la grille en un appel) des schémas de couleurs
+COLOR_SCHEME_BATCH_REGISTRY = {
+    "monochrome": Monochrome.get_colors_for_positions,
+    "black_white_radial": BlackWhiteRadial.get_colors_for_positions,
+    "black_white_alternating": BlackWhiteAlternating.get_colors_for_positions,
+    "gradient": Gradient.get_colors_for_positions,
+    "rainbow": Rainbow.get_colors_for_positions,
+    "complementary": Complementary.get_colors_for_positions,
+    "temperature": Temperature.get_colors_for_positions,
+    "pastel": Pastel.get_colors_for_positions,
+    "neon": Neon.get_colors_for_positions,
+    "ocean": Ocean.get_colors_for_positions,
+    "fire": Fire.get_colors_for_positions,
+    "forest": Forest.get_colors_for_positions,
+    "analogous": Analogous.get_colors_for_positions,
+    "cyberpunk": Cyberpunk.get_colors_for_positions,
+    "aurora_borealis": AuroraBorealis.get_colors_for_positions,
+    "infrared_thermal": InfraredThermal.get_colors_for_positions,
+    "duotone_accent": DuotoneAccent.get_colors_for_positions,
+    "desert": Desert.get_colors_for_positions,
+    "metallics": Metallics.get_colors_for_positions,
+    "reggae": Reggae.get_colors_for_positions,
+    "sunset": Sunset.get_colors_for_positions,
+    "pop_art": PopArt.get_colors_for_positions,
+    "vaporwave": Vaporwave.get_colors_for_positions,
+    "candy_shop": CandyShop.get_colors_for_positions,
+}
+
 
 def get_color_scheme_function(color_scheme: str):
     """
@@ -74,6 +107,19 @@ def get_color_scheme_function(color_scheme: str):
     return COLOR_SCHEME_REGISTRY.get(color_scheme, Monochrome.get_color_for_position)
 
 
+def get_color_scheme_batch_function(color_scheme: str):
+    """
+    Retourne la fonction vectorisée de génération de couleurs du schéma.
+    
+    Args:
+        color_scheme: Nom du schéma de couleur
+        
+    Returns:
+        Fonction (square_color, x_norms, y_norms, distances, indices, dimension) -> ndarray (N, 3)
+    """
+    return COLOR_SCHEME_BATCH_REGISTRY.get(color_scheme, Monochrome.get_colors_for_positions)
+
+
 class ColorGenerator:
     """
     Générateur de couleurs selon différents schémas - version refactorisée.
@@ -110,6 +156,50 @@ class ColorGenerator:
             square_color, x_norm, y_norm, distance_to_center, index, dimension
         )
     
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def get_grid_colors(color_scheme: str, square_color: tuple, dimension: int) -> np.ndarray:
+        """
+        Génère les couleurs de base de toute une grille dimension x dimension.
+        
+        Les schémas de couleurs sont déterministes : le résultat est mis en cache,
+        si bien que revenir à un schéma déjà utilisé ne recalcule rien.
+        
+        Args:
+            color_scheme: Nom du schéma de couleur
+            square_color: Couleur de base pour le schéma monochrome (tuple)
+            dimension: Nombre de cellules par ligne/colonne
+            
+        Returns:
+            ndarray (N, 3) uint8 en lecture seule, une ligne RGB par cellule
+        """
+        # Normalisation des coordonnées (0.0 à 1.0), calculée pour toute la grille
+        if dimension > 1:
+            coords = np.arange(dimension, dtype=np.float64) / (dimension - 1)
+        else:
+            coords = np.full(dimension, 0.5)
+        x_norms = np.tile(coords, dimension)
+        y_norms = np.repeat(coords, dimension)
+        
+        # Distance au centre normalisée, sans temporaires pour les carrés
+        dx = x_norms - 0.5
+        dy = y_norms - 0.5
+        d2 = dx * dx
+        d2 += dy * dy
+        distances = np.sqrt(d2, out=d2)
+        distances /= 0.707
+        np.minimum(distances, 1.0, out=distances)  # Normalise à [0,1]
+        
+        colors_function = get_color_scheme_batch_function(color_scheme)
+        colors = colors_function(
+            square_color, x_norms, y_norms, distances,
+            np.arange(dimension * dimension), dimension
+        )
+        
+        # Le tableau est partagé par le cache : interdire toute modification
+        colors.flags.writeable = False
+        return colors
+    
     @staticmethod
     def get_animated_color(base_color, position_index: int, time: float, color_animation: bool):
         """
@@ -142,6 +232,61 @@ class ColorGenerator:
             g = int(min(255, g * pulse))
             b = int(min(255, b * pulse))
             return (r, g, b)
+    
+    @staticmethod
+    def get_animated_colors(base_colors: np.ndarray, time: float,
+                            out: np.ndarray = None) -> np.ndarray:
+        """
+        Applique l'animation de couleur de get_animated_color à toute la grille.
+        
+        Noyau Numba compilé si disponible (voir color_kernels), NumPy sinon.
+        
+        Args:
+            base_colors: ndarray (N, 3) uint8 des couleurs de base
+            time: Temps actuel pour l'animation
+            out: ndarray (N, 3) uint8 réutilisé pour le résultat (alloué si None)
+            
+        Returns:
+            ndarray (N, 3) uint8 des couleurs animées
+        """
+        if out is None:
+            out = np.empty(base_colors.shape, dtype=np.uint8)
+        
+        if color_kernels.NUMBA_AVAILABLE:
+            color_kernels.animate_colors(base_colors, out, float(time))
+            return out
+        
+        pulse = np.sin(time * 2 + np.arange(len(base_colors)) * 0.1)
+        pulse *= 0.2
+        pulse += 1.0
+        np.clip(pulse, 0.5, 1.5, out=pulse)
+        scaled = base_colors * pulse[:, np.newaxis]
+        np.minimum(scaled, 255, out=scaled)
+        out[...] = scaled  # conversion en uint8 par troncature, comme int()
+        return out
+    
+    @staticmethod
+    def quantize_colors(colors: np.ndarray, bits: int, out: np.ndarray = None) -> np.ndarray:
+        """
+        Ramène chaque canal au centre de son intervalle sur 2**bits niveaux.
+        
+        Limite le nombre de couleurs distinctes (au plus 2**(3*bits)), par
+        exemple pour réutiliser des sprites pré-rendus.
+        
+        Args:
+            colors: ndarray (N, 3) uint8 des couleurs
+            bits: Nombre de bits conservés par canal (1 à 8)
+            out: ndarray (N, 3) uint8 pour le résultat (peut être colors lui-même)
+            
+        Returns:
+            ndarray (N, 3) uint8 des couleurs quantifiées
+        """
+        dropped_bits = 8 - bits
+        mask = (0xFF << dropped_bits) & 0xFF
+        center = (1 << dropped_bits) >> 1
+        out = np.bitwise_and(colors, np.uint8(mask), out=out)
+        out |= np.uint8(center)
+        return out
 
 
 __all__ = [
@@ -152,5 +297,7 @@ __all__ = [
     'Desert', 'Metallics', 'Reggae', 'Sunset', 'PopArt', 'Vaporwave', 'CandyShop',
     'ColorGenerator',
     'get_color_scheme_function',
-    'COLOR_SCHEME_REGISTRY'
+    'get_color_scheme_batch_function',
+    'COLOR_SCHEME_REGISTRY',
+    'COLOR_SCHEME_BATCH_REGISTRY'
 ]
\ No newline at end of file
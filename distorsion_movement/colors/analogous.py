@@ -4,6 +4,8 @@ Schéma de couleur analogues.
 
 import math
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -37,4 +39,37 @@ class Analogous(BaseColor):
         hue_shift = (x_norm - 0.5) * 0.3 + (y_norm - 0.5) * 0.3  # ±0.3 spread
         sat = 0.5 + 0.5 * (0.5 - distance_to_center)  # more saturated near center
         val = 0.7 + 0.3 * math.sin(index * 0.1)  # subtle brightness wave
-        return BaseColor._hsv_to_rgb_clamped((base_hue + hue_shift) % 1.0, sat, val)
\ No newline at end of file
+        return BaseColor._hsv_to_rgb_clamped((base_hue + hue_shift) % 1.0, sat, val)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs analogues avec des variations de teinte pour toute la grille.
+        
+        La teinte, la saturation et la luminosité sont calculées sur des tableaux
+        NumPy, puis converties en RGB en un seul appel à _hsv_to_rgb_array.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur analogue RGB
+        """
+        base_hue = 0.3  # green-ish
+        hue_shift = (x_norms - 0.5) * 0.3 + (y_norms - 0.5) * 0.3  # ±0.3 spread
+        sat = 0.5 + 0.5 * (0.5 - distances)  # more saturated near center
+        val = 0.7 + 0.3 * np.sin(indices * 0.1)  # subtle brightness wave
+        return BaseColor._hsv_to_rgb_array((base_hue + hue_shift) % 1.0, sat, val)
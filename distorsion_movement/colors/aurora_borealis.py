@@ -4,6 +4,8 @@ Schéma de couleur aurore boréale.
 
 import math
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -38,4 +40,37 @@ class AuroraBorealis(BaseColor):
         hue = (hue_center + (math.sin(index * 0.05) * 0.15)) % 1.0  # shifting into purple/blue range
         sat = 0.7 + 0.3 * math.sin(y_norm * 5 + distance_to_center * 3)  # dynamic saturation
         val = 0.6 + 0.4 * math.cos(x_norm * 4 + distance_to_center * 2)  # gentle brightness movement
-        return BaseColor._hsv_to_rgb_clamped(hue, sat, val)
\ No newline at end of file
+        return BaseColor._hsv_to_rgb_clamped(hue, sat, val)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs d'aurore boréale avec effet ondulant pour toute la grille.
+        
+        Les ondulations (sinus et cosinus) sont évaluées pour toutes les cellules
+        à la fois, avant une seule conversion HSV vers RGB.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur d'aurore boréale RGB
+        """
+        hue_center = 0.4 + np.sin((x_norms + y_norms + distances) * 4) * 0.1
+        hue = (hue_center + (np.sin(indices * 0.05) * 0.15)) % 1.0
+        sat = 0.7 + 0.3 * np.sin(y_norms * 5 + distances * 3)
+        val = 0.6 + 0.4 * np.cos(x_norms * 4 + distances * 2)
+        return BaseColor._hsv_to_rgb_array(hue, sat, val)
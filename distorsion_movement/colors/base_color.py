@@ -9,6 +9,8 @@ import math
 import colorsys
 from typing import Tuple
 
+import numpy as np
+
 
 class BaseColor:
     """Classe de base pour tous les schémas de couleurs."""
@@ -40,6 +42,44 @@ class BaseColor:
         """
         raise NotImplementedError("Chaque schéma de couleur doit implémenter cette méthode")
     
+    @classmethod
+    def get_colors_for_positions(
+        cls,
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère les couleurs de toutes les cellules en un seul appel.
+        
+        Par défaut, get_color_for_position est appelée pour chaque cellule ; les
+        schémas exprimables en opérations NumPy redéfinissent cette méthode.
+        
+        Args:
+            square_color: Couleur de base pour le schéma monochrome
+            x_norms, y_norms: Positions normalisées des cellules (0.0 à 1.0)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des cellules dans la grille
+            dimension: Dimension de la grille (pour calculs)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne RGB par cellule
+        """
+        colors = np.empty((len(indices), 3), dtype=np.uint8)
+        for i, (x_norm, y_norm, distance_to_center, index) in enumerate(
+            zip(x_norms.tolist(), y_norms.tolist(), distances.tolist(), indices.tolist())
+        ):
+            colors[i] = np.clip(
+                cls.get_color_for_position(
+                    square_color, x_norm, y_norm, distance_to_center, index, dimension
+                ),
+                0, 255
+            )
+        return colors
+    
     @staticmethod
     def _clamp_rgb(r: float, g: float, b: float) -> Tuple[int, int, int]:
         """
@@ -96,4 +136,74 @@ class BaseColor:
         v = max(0.0, min(1.0, v))
         
         r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return BaseColor._clamp_rgb(r * 255, g * 255, b * 255)
\ No newline at end of file
+        return BaseColor._clamp_rgb(r * 255, g * 255, b * 255)
+    
+    @staticmethod
+    def _clamp_rgb_array(r, g, b) -> np.ndarray:
+        """
+        Version vectorisée de _clamp_rgb (troncature comme int(), puis [0, 255]).
+        
+        Args:
+            r, g, b: Tableaux (ou scalaires) des composantes RGB
+            
+        Returns:
+            ndarray (N, 3) uint8
+        """
+        rgb = np.stack(np.broadcast_arrays(r, g, b), axis=-1).astype(np.float64)
+        np.trunc(rgb, out=rgb)
+        np.clip(rgb, 0, 255, out=rgb)
+        return rgb.astype(np.uint8)
+    
+    @staticmethod
+    def _blend_colors_array(colors1, colors2, blend) -> np.ndarray:
+        """
+        Version vectorisée de _blend_colors.
+        
+        Args:
+            colors1: Premières couleurs RGB, (N, 3) ou (3,)
+            colors2: Deuxièmes couleurs RGB, (N, 3) ou (3,)
+            blend: Facteurs de mélange (N,) (0.0 = colors1, 1.0 = colors2)
+            
+        Returns:
+            ndarray (N, 3) uint8
+        """
+        colors1 = np.asarray(colors1, dtype=np.float64)
+        colors2 = np.asarray(colors2, dtype=np.float64)
+        blend = np.clip(blend, 0.0, 1.0)[:, np.newaxis]
+        rgb = colors1 + (colors2 - colors1) * blend
+        return BaseColor._clamp_rgb_array(rgb[:, 0], rgb[:, 1], rgb[:, 2])
+    
+    @staticmethod
+    def _hsv_to_rgb_array(h, s, v) -> np.ndarray:
+        """
+        Version vectorisée de _hsv_to_rgb_clamped (mêmes formules que colorsys).
+        
+        Args:
+            h: Hues (0.0 à 1.0)
+            s: Saturations (0.0 à 1.0)
+            v: Values/Brightness (0.0 à 1.0)
+            
+        Returns:
+            ndarray (N, 3) uint8
+        """
+        h, s, v = np.broadcast_arrays(
+            np.asarray(h, dtype=np.float64) % 1.0,
+            np.clip(s, 0.0, 1.0),
+            np.clip(v, 0.0, 1.0)
+        )
+        sector = (h * 6.0).astype(np.int64)
+        f = (h * 6.0) - sector
+        p = v * (1.0 - s)
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+        sector %= 6
+        
+        r = np.choose(sector, [v, q, p, p, t, v])
+        g = np.choose(sector, [t, v, v, q, p, p])
+        b = np.choose(sector, [p, p, t, v, v, q])
+        # Saturation nulle : gris
+        gray = s == 0.0
+        r = np.where(gray, v, r)
+        g = np.where(gray, v, g)
+        b = np.where(gray, v, b)
+        return BaseColor._clamp_rgb_array(r * 255, g * 255, b * 255)
\ No newline at end of file
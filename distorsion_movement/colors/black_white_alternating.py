@@ -3,6 +3,8 @@ Schéma de couleur noir et blanc alternant (damier).
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -36,4 +38,37 @@ class BlackWhiteAlternating(BaseColor):
         col = index % dimension
         # Pattern damier classique
         is_white = (row + col) % 2 == 0
-        return (255, 255, 255) if is_white else (0, 0, 0)
\ No newline at end of file
+        return (255, 255, 255) if is_white else (0, 0, 0)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère un pattern de damier noir et blanc pour toute la grille.
+        
+        La parité ligne + colonne de chaque cellule choisit directement le noir
+        ou le blanc.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur noir ou blanc selon la position dans le damier
+        """
+        # Pattern damier classique
+        rows = indices // dimension
+        cols = indices % dimension
+        white = (rows + cols) % 2 == 0
+        return np.repeat(np.where(white, 255, 0).astype(np.uint8)[:, np.newaxis], 3, axis=1)
@@ -3,6 +3,8 @@ Schéma de couleur noir et blanc radial.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -40,4 +42,34 @@ class BlackWhiteRadial(BaseColor):
             return (0, 0, 0)  # Noir aux bords
         else:
             # Zone intermédiaire : alternance selon l'index
-            return (255, 255, 255) if (index % 2 == 0) else (0, 0, 0)
\ No newline at end of file
+            return (255, 255, 255) if (index % 2 == 0) else (0, 0, 0)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère du noir et blanc selon la distance au centre pour toute la grille.
+        
+        Un masque booléen combine les seuils de distance et la parité de l'index.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur noir ou blanc selon la distance
+        """
+        # Blanc au centre, noir aux bords, alternance selon l'index entre les deux
+        white = (distances < 0.3) | ((distances <= 0.7) & (indices % 2 == 0))
+        return np.repeat(np.where(white, 255, 0).astype(np.uint8)[:, np.newaxis], 3, axis=1)
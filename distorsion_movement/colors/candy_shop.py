@@ -3,6 +3,8 @@ Schéma de couleur magasin de bonbons.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -42,4 +44,40 @@ class CandyShop(BaseColor):
         col = index % dimension
 
         # Checkerboard cycling through candy colors
-        return palette[(row + col) % len(palette)]
\ No newline at end of file
+        return palette[(row + col) % len(palette)]
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs de bonbons en damier pour toute la grille.
+        
+        La palette est indexée par (ligne + colonne) % 3, sans boucle Python.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur bonbon RGB
+        """
+        palette = np.array([
+            (255, 105, 180),  # bubblegum
+            (152, 255, 152),  # mint
+            (255, 250, 102),  # lemon
+        ], dtype=np.uint8)
+        rows = indices // dimension
+        cols = indices % dimension
+        # Checkerboard cycling through candy colors
+        return palette[(rows + cols) % len(palette)]
@@ -3,6 +3,8 @@ Schéma de couleur complémentaire.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -35,4 +37,34 @@ class Complementary(BaseColor):
         if (index + (index // dimension)) % 2 == 0:
             return (255, 100, 50)  # Orange
         else:
-            return (50, 150, 255)  # Bleu
\ No newline at end of file
+            return (50, 150, 255)  # Bleu
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs complémentaires alternées pour toute la grille.
+        
+        La parité de l'index, décalée à chaque ligne, sélectionne l'une des deux
+        couleurs de la palette.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur orange ou bleue complémentaire
+        """
+        palette = np.array([(255, 100, 50), (50, 150, 255)], dtype=np.uint8)  # Orange, bleu
+        return palette[(indices + (indices // dimension)) % 2]
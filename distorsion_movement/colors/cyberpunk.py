@@ -3,6 +3,8 @@ Schéma de couleur cyberpunk.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -38,4 +40,36 @@ class Cyberpunk(BaseColor):
         sat = 1.0
         # Bright at center, darker towards edges
         val = 0.6 + 0.4 * (1.0 - distance_to_center)
-        return BaseColor._hsv_to_rgb_clamped(hue, sat, val)
\ No newline at end of file
+        return BaseColor._hsv_to_rgb_clamped(hue, sat, val)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs cyberpunk avec magenta et cyan néon pour toute la grille.
+        
+        La teinte de base (magenta ou cyan) est choisie par np.where selon la
+        parité, puis décalée selon la position.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur cyberpunk RGB
+        """
+        hue_base = np.where((indices + (indices // dimension)) % 2 == 0, 0.83, 0.5)  # magenta or cyan
+        hue = (hue_base + (x_norms - 0.5) * 0.1 + (y_norms - 0.5) * 0.1) % 1.0
+        val = 0.6 + 0.4 * (1.0 - distances)
+        return BaseColor._hsv_to_rgb_array(hue, 1.0, val)
@@ -3,6 +3,8 @@ Schéma de couleur thème désert.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -45,4 +47,37 @@ class Desert(BaseColor):
             return orange
         else:
             # Outer ring: deep brown
-            return brown
\ No newline at end of file
+            return brown
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs de désert selon la zone pour toute la grille.
+        
+        Les zones sont appliquées par masques de distance, de la plus lointaine
+        à la plus proche du centre.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur de désert selon la zone
+        """
+        colors = np.empty((len(indices), 3), dtype=np.uint8)
+        colors[:] = (102, 51, 0)  # Outer ring: deep brown
+        colors[distances < 0.66] = (210, 125, 45)  # Mid ring: warm orange
+        colors[distances < 0.33] = (237, 201, 175)  # Center: light sand
+        return colors
@@ -3,6 +3,8 @@ Schéma de couleur duotone avec accent.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -59,4 +61,46 @@ class DuotoneAccent(BaseColor):
         if combined_pattern == 0:
             return color_a
         else:
-            return color_b
\ No newline at end of file
+            return color_b
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère un duotone avec accent rare pour toute la grille.
+        
+        La graine de l'accent et les motifs du duotone sont calculés sur les
+        tableaux de lignes et de colonnes.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur duotone avec accent occasionnel
+        """
+        palette = np.array([
+            (30, 144, 255),   # Dodger blue
+            (255, 105, 180),  # Hot pink
+            (255, 255, 0),    # Bright yellow pop
+        ], dtype=np.uint8)
+        rows = indices // dimension
+        cols = indices % dimension
+        seed = (rows * 73 + cols * 151 + rows * cols * 23) % 997
+        pattern1 = (rows // 2 + cols // 2) % 2
+        pattern2 = (rows + cols) % 3
+        pattern3 = ((rows * 3) % 7 + (cols * 2) % 5) % 2
+        combined_pattern = (pattern1 + pattern2 + pattern3) % 2
+        # Rare accent (~4%), sinon duotone
+        return palette[np.where(seed < 40, 2, combined_pattern)]
@@ -3,6 +3,8 @@ Schéma de couleur thème feu.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -38,4 +40,38 @@ class Fire(BaseColor):
         elif intensity > 0.5:
             return (255, 140, 0)    # Orange
         else:
-            return (220, 20, 60)    # Rouge foncé
\ No newline at end of file
+            return (220, 20, 60)    # Rouge foncé
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs de feu selon l'intensité pour toute la grille.
+        
+        Les seuils d'intensité sont appliqués par masques successifs, du rouge
+        au jaune.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur de feu selon l'intensité
+        """
+        intensity = 1.0 - distances + y_norms * 0.3
+        colors = np.empty((len(indices), 3), dtype=np.uint8)
+        colors[:] = (220, 20, 60)  # Rouge foncé
+        colors[intensity > 0.5] = (255, 140, 0)  # Orange
+        colors[intensity > 0.8] = (255, 255, 100)  # Jaune chaud
+        return colors
@@ -3,6 +3,8 @@ Schéma de couleur thème forêt.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -38,4 +40,38 @@ class Forest(BaseColor):
         elif green_intensity > 0.5:
             return (34, 139, 34)    # Vert forêt
         else:
-            return (0, 100, 0)      # Vert foncé
\ No newline at end of file
+            return (0, 100, 0)      # Vert foncé
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs de forêt avec différentes nuances de vert pour toute la grille.
+        
+        Les seuils de l'intensité verte sont appliqués par masques successifs,
+        du vert foncé au vert clair.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur de forêt selon l'intensité verte
+        """
+        green_intensity = 0.3 + distances * 0.7 + x_norms * 0.2
+        colors = np.empty((len(indices), 3), dtype=np.uint8)
+        colors[:] = (0, 100, 0)  # Vert foncé
+        colors[green_intensity > 0.5] = (34, 139, 34)  # Vert forêt
+        colors[green_intensity > 0.8] = (144, 238, 144)  # Vert clair
+        return colors
@@ -3,6 +3,8 @@ Schéma de couleur en gradient diagonal.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -36,4 +38,36 @@ class Gradient(BaseColor):
         r = int(50 + t * 205)
         g = int(100 + t * 155)
         b = int(200 - t * 100)
-        return BaseColor._clamp_rgb(r, g, b)
\ No newline at end of file
+        return BaseColor._clamp_rgb(r, g, b)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère un gradient diagonal pour toute la grille.
+        
+        Les trois canaux sont interpolés sur la diagonale puis tronqués comme
+        dans la version scalaire.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur RGB du gradient
+        """
+        t = (x_norms + y_norms) / 2.0
+        return BaseColor._clamp_rgb_array(
+            np.trunc(50 + t * 205), np.trunc(100 + t * 155), np.trunc(200 - t * 100)
+        )
@@ -3,6 +3,8 @@ Schéma de couleur infrarouge thermique.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -74,4 +76,51 @@ class InfraredThermal(BaseColor):
             sat = 0.7 - progress * 0.7  # fully desaturate
             val = 1.0
 
-        return BaseColor._hsv_to_rgb_clamped(hue, sat, val)
\ No newline at end of file
+        return BaseColor._hsv_to_rgb_clamped(hue, sat, val)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs thermiques infrarouge pour toute la grille.
+        
+        Chaque tranche de température est sélectionnée par np.select, pour la
+        teinte, la saturation et la luminosité.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur thermique RGB
+        """
+        t = 1.0 - distances  # invert so center is cold, edges are hot
+        conditions = [t < 0.16, t < 0.33, t < 0.5, t < 0.66, t < 0.83, t < 0.92]
+        hue = np.select(conditions, [
+            0.66 - (t / 0.16) * 0.08,
+            0.58 - ((t - 0.16) / 0.17) * 0.25,
+            0.33 - ((t - 0.33) / 0.17) * 0.17,
+            0.16 - ((t - 0.5) / 0.16) * 0.08,
+            0.08 - ((t - 0.66) / 0.17) * 0.08,
+            0.0,
+        ], 0.0)
+        sat = np.select(conditions, [
+            1.0, 1.0, 1.0, 1.0, 1.0,
+            1.0 - ((t - 0.83) / 0.09) * 0.3,
+        ], 0.7 - ((t - 0.92) / 0.08) * 0.7)
+        val = np.select(conditions[:2], [
+            0.3 + (t / 0.16) * 0.4,
+            0.7 + ((t - 0.16) / 0.17) * 0.3,
+        ], 1.0)
+        return BaseColor._hsv_to_rgb_array(hue, sat, val)
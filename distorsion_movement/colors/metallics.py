@@ -3,6 +3,8 @@ Schéma de couleur métalliques.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -50,4 +52,41 @@ class Metallics(BaseColor):
         else:
             # Blend from bronze back to gold
             blend = (t - 0.66) / 0.34
-            return BaseColor._blend_colors(bronze, gold, blend)
\ No newline at end of file
+            return BaseColor._blend_colors(bronze, gold, blend)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs métalliques avec gradients pour toute la grille.
+        
+        Chaque cellule est rattachée à un segment or/argent/bronze, puis les
+        couleurs sont mélangées par _blend_colors_array.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur métallique RGB
+        """
+        gold = (212, 175, 55)
+        silver = (192, 192, 192)
+        bronze = (205, 127, 50)
+        t = (x_norms + y_norms) / 2.0  # 0..1 diagonal gradient
+        segment = np.select([t < 0.33, t < 0.66], [0, 1], 2)
+        starts = np.array([gold, silver, bronze], dtype=np.float64)[segment]
+        ends = np.array([silver, bronze, gold], dtype=np.float64)[segment]
+        blend = np.select([t < 0.33, t < 0.66], [t / 0.33, (t - 0.33) / 0.33], (t - 0.66) / 0.34)
+        return BaseColor._blend_colors_array(starts, ends, blend)
@@ -3,6 +3,8 @@ Schéma de couleur monochrome.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -32,4 +34,34 @@ class Monochrome(BaseColor):
         Returns:
             La couleur de base inchangée
         """
-        return square_color
\ No newline at end of file
+        return square_color
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Retourne la couleur de base sans modification pour toute la grille.
+        
+        La couleur de base, bornée à [0, 255], est recopiée sur chaque ligne.
+        
+        Args:
+            square_color: Couleur de base
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            la couleur de base inchangée
+        """
+        colors = np.empty((len(indices), 3), dtype=np.uint8)
+        colors[:] = np.clip(square_color, 0, 255)
+        return colors
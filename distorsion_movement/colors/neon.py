@@ -3,6 +3,8 @@ Schéma de couleur néon.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -33,4 +35,34 @@ class Neon(BaseColor):
             Couleur néon RGB
         """
         hue = (distance_to_center + x_norm * 0.5) % 1.0
-        return BaseColor._hsv_to_rgb_clamped(hue, 1.0, 1.0)
\ No newline at end of file
+        return BaseColor._hsv_to_rgb_clamped(hue, 1.0, 1.0)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs néon vives pour toute la grille.
+        
+        La teinte dépend de la distance et de la position X ; saturation et
+        luminosité sont maximales.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur néon RGB
+        """
+        hue = (distances + x_norms * 0.5) % 1.0
+        return BaseColor._hsv_to_rgb_array(hue, 1.0, 1.0)
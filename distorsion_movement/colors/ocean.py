@@ -3,6 +3,8 @@ Schéma de couleur thème océan.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -41,4 +43,37 @@ class Ocean(BaseColor):
             return (0, 119, 190)
         else:
             # Eau profonde - bleu foncé
-            return (25, 25, 112)
\ No newline at end of file
+            return (25, 25, 112)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs océan selon la profondeur pour toute la grille.
+        
+        Les profondeurs sont appliquées par masques de distance, de l'eau
+        profonde au turquoise.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur océan selon la profondeur
+        """
+        colors = np.empty((len(indices), 3), dtype=np.uint8)
+        colors[:] = (25, 25, 112)  # Eau profonde - bleu foncé
+        colors[distances < 0.7] = (0, 119, 190)  # Eau moyenne - bleu océan
+        colors[distances < 0.3] = (64, 224, 208)  # Eau peu profonde - turquoise
+        return colors
@@ -3,6 +3,8 @@ Schéma de couleur pastel.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -33,4 +35,34 @@ class Pastel(BaseColor):
             Couleur pastel RGB
         """
         hue = (x_norm * 0.3 + y_norm * 0.7) % 1.0
-        return BaseColor._hsv_to_rgb_clamped(hue, 0.3, 0.9)
\ No newline at end of file
+        return BaseColor._hsv_to_rgb_clamped(hue, 0.3, 0.9)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs pastel douces pour toute la grille.
+        
+        Seule la teinte varie : la saturation faible et la luminosité élevée
+        sont communes à toute la grille.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur pastel RGB
+        """
+        hue = (x_norms * 0.3 + y_norms * 0.7) % 1.0
+        return BaseColor._hsv_to_rgb_array(hue, 0.3, 0.9)
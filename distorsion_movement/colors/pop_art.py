@@ -3,6 +3,8 @@ Schéma de couleur pop art.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -47,4 +49,45 @@ class PopArt(BaseColor):
             return (0, 0, 0) if (row + col) % 2 == 0 else (255, 255, 255)
 
         # Otherwise, cycle through bright primaries
-        return primaries[(row + col) % len(primaries)]
\ No newline at end of file
+        return primaries[(row + col) % len(primaries)]
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs pop art avec primaires et contours pour toute la grille.
+        
+        Les primaires sont indexées par (ligne + colonne) % 4, puis les cellules
+        des contours sont remplacées par du noir ou du blanc.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur pop art RGB
+        """
+        primaries = np.array([
+            (255, 0, 0),    # Red
+            (0, 0, 255),    # Blue
+            (255, 255, 0),  # Yellow
+            (0, 255, 0),    # Green
+        ], dtype=np.uint8)
+        rows = indices // dimension
+        cols = indices % dimension
+        colors = primaries[(rows + cols) % len(primaries)]
+        # Every Nth cell becomes black/white for a bold outline effect
+        outline = (rows % 5 == 0) | (cols % 5 == 0)
+        colors[outline] = np.where(((rows + cols) % 2 == 0)[outline], 0, 255)[:, np.newaxis]
+        return colors
@@ -3,6 +3,8 @@ Schéma de couleur arc-en-ciel.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -33,4 +35,34 @@ class Rainbow(BaseColor):
             Couleur RGB de l'arc-en-ciel
         """
         hue = (x_norm + y_norm * 0.5) % 1.0
-        return BaseColor._hsv_to_rgb_clamped(hue, 0.8, 0.9)
\ No newline at end of file
+        return BaseColor._hsv_to_rgb_clamped(hue, 0.8, 0.9)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs arc-en-ciel selon la position pour toute la grille.
+        
+        La teinte est calculée sur toute la grille avant une seule conversion
+        HSV vers RGB.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (0.0 à 1.0)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur RGB de l'arc-en-ciel
+        """
+        hue = (x_norms + y_norms * 0.5) % 1.0
+        return BaseColor._hsv_to_rgb_array(hue, 0.8, 0.9)
@@ -3,6 +3,8 @@ Schéma de couleur thème reggae.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -45,4 +47,36 @@ class Reggae(BaseColor):
             return yellow
         else:
             # Outer ring: red
-            return red
\ No newline at end of file
+            return red
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs reggae selon la zone pour toute la grille.
+        
+        Les bandes vert, jaune et rouge sont appliquées par masques de distance.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur reggae selon la zone
+        """
+        colors = np.empty((len(indices), 3), dtype=np.uint8)
+        colors[:] = (204, 0, 0)  # Outer ring: red
+        colors[distances < 0.66] = (255, 204, 0)  # Mid ring: yellow
+        colors[distances < 0.33] = (0, 153, 51)  # Center: green
+        return colors
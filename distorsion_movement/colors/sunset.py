@@ -3,6 +3,8 @@ Schéma de couleur coucher de soleil.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -51,4 +53,42 @@ class Sunset(BaseColor):
         else:
             # Pink to purple
             blend = (t - 0.66) / 0.34
-            return BaseColor._blend_colors(pink, purple, blend)
\ No newline at end of file
+            return BaseColor._blend_colors(pink, purple, blend)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère un gradient de coucher de soleil vertical pour toute la grille.
+        
+        Chaque cellule est rattachée à un segment du dégradé vertical, puis les
+        couleurs sont mélangées par _blend_colors_array.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (0.0 à 1.0)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur de coucher de soleil RGB
+        """
+        yellow = (255, 223, 0)
+        orange = (255, 140, 0)
+        pink = (255, 105, 180)
+        purple = (128, 0, 128)
+        t = y_norms  # 0 = top, 1 = bottom
+        segment = np.select([t < 0.33, t < 0.66], [0, 1], 2)
+        starts = np.array([yellow, orange, pink], dtype=np.float64)[segment]
+        ends = np.array([orange, pink, purple], dtype=np.float64)[segment]
+        blend = np.select([t < 0.33, t < 0.66], [t / 0.33, (t - 0.33) / 0.33], (t - 0.66) / 0.34)
+        return BaseColor._blend_colors_array(starts, ends, blend)
@@ -3,6 +3,8 @@ Schéma de couleur basé sur la température.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -41,4 +43,37 @@ class Temperature(BaseColor):
             return BaseColor._hsv_to_rgb_clamped(0.05, 0.9, 0.9)
         else:
             # Froid - bleu/violet
-            return BaseColor._hsv_to_rgb_clamped(0.6 + temp * 0.2, 0.7, 0.8)
\ No newline at end of file
+            return BaseColor._hsv_to_rgb_clamped(0.6 + temp * 0.2, 0.7, 0.8)
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs selon la température basée sur la distance au centre pour toute la grille.
+        
+        Les couleurs froides sont calculées par tableaux ; les zones chaudes et
+        très chaudes sont ensuite écrasées par masques.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre normalisées (0.0 à 1.0)
+            indices: Index des carrés (non utilisés)
+            dimension: Dimension de la grille (non utilisée)
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur chaude (centre) ou froide (bords)
+        """
+        temp = 1.0 - distances
+        colors = BaseColor._hsv_to_rgb_array(0.6 + temp * 0.2, 0.7, 0.8)  # Froid
+        colors[temp > 0.4] = BaseColor._hsv_to_rgb_clamped(0.05, 0.9, 0.9)  # Chaud
+        colors[temp > 0.7] = BaseColor._hsv_to_rgb_clamped(0.1, 0.8, 1.0)  # Très chaud
+        return colors
@@ -3,6 +3,8 @@ Schéma de couleur vaporwave.
 """
 
 from typing import Tuple
+
+import numpy as np
 from .base_color import BaseColor
 
 
@@ -43,4 +45,41 @@ class Vaporwave(BaseColor):
         col = index % dimension
 
         # Checkerboard pattern cycling through palette
-        return palette[(row + col) % len(palette)]
\ No newline at end of file
+        return palette[(row + col) % len(palette)]
+    
+    @staticmethod
+    def get_colors_for_positions(
+        square_color: Tuple[int, int, int],
+        x_norms: np.ndarray,
+        y_norms: np.ndarray,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        dimension: int
+    ) -> np.ndarray:
+        """
+        Génère des couleurs vaporwave en damier pour toute la grille.
+        
+        La palette est indexée par (ligne + colonne) % 4, sans boucle Python.
+        
+        Args:
+            square_color: Couleur de base (non utilisée)
+            x_norms: Positions X normalisées (non utilisées)
+            y_norms: Positions Y normalisées (non utilisées)
+            distances: Distances au centre (non utilisées)
+            indices: Index des carrés dans la grille
+            dimension: Dimension de la grille
+            
+        Returns:
+            ndarray (N, 3) uint8, une ligne par cellule :
+            couleur vaporwave RGB
+        """
+        palette = np.array([
+            (181, 126, 220),  # lavender
+            (0, 255, 255),    # cyan
+            (255, 203, 164),  # peach
+            (255, 105, 180),  # pink
+        ], dtype=np.uint8)
+        rows = indices // dimension
+        cols = indices % dimension
+        # Checkerboard pattern cycling through palette
+        return palette[(rows + cols) % len(palette)]
@@ -8,22 +8,32 @@ mais structuré.
 
 import pygame
 import numpy as np
-import math
 import random
 import datetime
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from typing import Tuple, List
 
 from distorsion_movement.enums import DistortionType, ColorScheme, ShapeType
 from distorsion_movement.colors import ColorGenerator
 from distorsion_movement.distortions import DistortionEngine
-from distorsion_movement.shapes import get_shape_renderer_function
+from distorsion_movement.shapes import get_shape_renderer_function, ShapeSpriteCache
+from distorsion_movement import distortion_kernels, color_kernels, frame_kernels
 
 import os 
 import imageio
 import yaml
+from PIL import Image, GifImagePlugin
 import glob
 
+# Parseur/émetteur YAML en C (libyaml) si PyYAML a été compilé avec
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 
 class DeformedGrid:
     """
@@ -33,6 +43,40 @@ class DeformedGrid:
     par déplacement, modification de forme, ou rotation légère.
     """
     
+    # Nombre de frames en attente d'écriture pendant l'enregistrement GIF
+    GIF_BUFFER_SLOTS = 8
+    # Facteur de réduction des frames du GIF (2 : moitié de la taille de l'écran)
+    GIF_DOWNSCALE = 2
+    # Indice de palette réservé aux pixels inchangés depuis la frame précédente
+    GIF_TRANSPARENT_INDEX = 255
+    
+    # Nombre maximal de surfaces de texte gardées en cache
+    TEXT_CACHE_SIZE = 256
+    
+    # Threads de lecture des scènes sauvegardées au début de l'itération
+    SCENE_PRELOAD_WORKERS = 8
+    
+    # Fraction de l'écran au-delà de laquelle _present met à jour tout l'écran
+    FULL_UPDATE_AREA_RATIO = 0.5
+    
+    # Bits conservés par canal pour les couleurs animées, et budget en pixels
+    # des sprites pré-rendus pour ces couleurs (32 Mo en RGBA)
+    ANIMATED_COLOR_BITS = 6
+    ANIMATED_SPRITE_CACHE_PIXELS = 1 << 23
+    
+    # Distorsions dont l'animation continue même à intensité nulle
+    ANIMATED_AT_ZERO_STRENGTH = frozenset({
+        DistortionType.SPIRAL.value,
+        DistortionType.NOISE_ROTATION.value,
+        DistortionType.KALEIDOSCOPE_TWIST.value,
+    })
+    
+    # Distorsions qui ne dépendent pas du temps : l'intensité n'est qu'un facteur
+    # appliqué aux paramètres aléatoires des cellules
+    TIME_INDEPENDENT_DISTORTIONS = frozenset({
+        DistortionType.RANDOM.value,
+    })
+    
     def __init__(self, 
                  dimension: int = 64,
                  cell_size: int = 8,
@@ -75,11 +119,6 @@ class DeformedGrid:
         
         self.base_distortion_strength = distortion_strength  # Sauvegarde de l'intensité de base
         
-        # Calcul automatique du décalage pour centrer la grille
-        grid_total_size = dimension * cell_size
-        self.offset_x = (canvas_size[0] - grid_total_size) // 2
-        self.offset_y = (canvas_size[1] - grid_total_size) // 2
-        
         # Variables pour l'animation
         self.time = 0.0
         self.animation_speed = 0.02
@@ -92,12 +131,31 @@ class DeformedGrid:
         self.show_status = True
         self.status_font = None
         
+        # Surfaces de texte déjà rendues, par (police, texte, couleur)
+        self._text_cache = OrderedDict()
+        # Menus déjà composés : texte de l'aide et panneau de statut (avec ses lignes)
+        self._help_surface = None
+        self._status_surface = None
+        self._status_lines = None
+        
+        # Tampon (N, 3) des positions déformées, réutilisé à chaque frame
+        self._positions_buffer = None
+        
         # Variables pour l'enregistrement GIF
         self.is_recording = False
-        self.recorded_frames = []
+        self.recorded_frame_count = 0
+        self.dropped_frame_count = 0  # Frames abandonnées faute de tampon libre
         self.max_frames = 900  # Max 15 secondes à 60 FPS
         self.frame_skip = 1  # Capturer chaque frame par défaut
         self.recording_start_time = None
+        # Tampons de frames préalloués et files partagées avec le thread d'écriture du GIF
+        self._gif_slots = None
+        self._gif_free_slots = None
+        self._gif_filled_slots = None
+        self._gif_thread = None
+        # Encodage des captures d'écran (S) hors de la boucle de rendu, dans l'ordre.
+        # Le thread n'est créé qu'à la première sauvegarde (voir _get_save_pool)
+        self._save_pool = None
         
         # Variables pour le contrôle dynamique de la densité de grille
         self.base_dimension = dimension  # Sauvegarder la dimension originale
@@ -107,6 +165,10 @@ class DeformedGrid:
         self.saved_scenes = []
         self.current_scene_index = -1
         self.scene_iteration_mode = False
+        self._scene_cache = {}  # Chemin YAML -> paramètres déjà lus
+        # Chemin YAML -> écriture en cours (Future) des captures (S) : tant qu'elle
+        # n'est pas terminée, l'entrée de _scene_cache fait foi
+        self._pending_scene_writes = {}
         
         # Initialisation pygame
         pygame.init()
@@ -117,10 +179,59 @@ class DeformedGrid:
         # Start in windowed mode but store both modes
         self.windowed_size = canvas_size
         self.is_fullscreen = False
-        self.screen = pygame.display.set_mode(canvas_size)
+        self.screen = self._set_display_mode(canvas_size)
         pygame.display.set_caption("Grille Déformée - Art Génératif")
         self.clock = pygame.time.Clock()
         
+        # Zones de l'écran modifiées depuis la dernière présentation (rectangles sales)
+        self._dirty = []
+        self._full_update = True  # Présenter tout l'écran à la prochaine frame
+        self._last_content_rect = None
+        self._status_rect = None
+        self._last_status_rect = None
+        self._help_visible = False
+        self._cleared_background = None  # Couleur de fond du dernier effacement complet
+        
+        # Vrai une fois l'image rendue ; remis à False par toute action de l'utilisateur
+        self._frame_drawn = False
+        # Nombre de frames rendues (cadence de capture du GIF avec frame_skip)
+        self._render_frame_idx = 0
+        
+        # Table des fonctions de rendu indexée par l'ordre de ShapeType :
+        # le rendu accède à la fonction par indice entier plutôt que par nom
+        self._shape_type_values = tuple(shape.value for shape in ShapeType)
+        self._shape_renderers = tuple(
+            get_shape_renderer_function(value) for value in self._shape_type_values
+        )
+        # Générateur aléatoire pour le tirage des formes en mode mixte
+        self._shape_rng = np.random.default_rng()
+        # Ordre de navigation des distorsions (SPACE) et des couleurs (C)
+        self._distortion_type_values = tuple(t.value for t in DistortionType)
+        self._color_scheme_values = tuple(c.value for c in ColorScheme)
+        
+        # Table touche -> méthode appelée avec (shift, ctrl) par run_interactive
+        self._running = False
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._on_quit_key,
+            pygame.K_i: self._on_help_key,
+            pygame.K_TAB: self._on_help_key,
+            pygame.K_d: self._on_status_key,
+            pygame.K_SPACE: self._on_distortion_key,
+            pygame.K_c: self._on_color_key,
+            pygame.K_a: self._on_color_animation_key,
+            pygame.K_t: self._on_density_mode_key,
+            pygame.K_PLUS: self._on_plus_key,
+            pygame.K_EQUALS: self._on_plus_key,
+            pygame.K_MINUS: self._on_minus_key,
+            pygame.K_r: self._on_regenerate_key,
+            pygame.K_s: self._on_save_key,
+            pygame.K_h: self._on_shape_key,
+            pygame.K_f: self._on_fullscreen_key,
+            pygame.K_g: self._on_gif_key,
+            pygame.K_l: self._on_scene_key,
+            pygame.K_p: self._on_refresh_scenes_key,
+        }
+        
         # Initialiser les polices pour le menu d'aide et l'affichage du statut
         try:
             pygame.font.init()  # Ensure font system is initialized
@@ -133,69 +244,112 @@ class DeformedGrid:
             self.help_title_font = None
             self.status_font = None
         
-        # Génération des positions de base et des déformations
+        # Génération des positions, déformations, couleurs et formes des cellules
+        self._regenerate_grid()
+            
+    def _regenerate_grid(self):
+        """
+        Génère toutes les données par cellule pour la dimension actuelle.
+        
+        Chaque générateur remplit ses tableaux en un seul appel vectorisé ;
+        _update_grid_density adapte les tableaux existants plutôt que de tout
+        régénérer.
+        """
         self._generate_base_positions()
         self._generate_distortions()
-        
-        # Génération des couleurs de base pour chaque carré
         self._generate_base_colors()
-        
-        # Génération des types de formes pour chaque cellule
         self._generate_shape_types()
-            
+    
+    @property
+    def offset_x(self) -> int:
+        """Décalage horizontal qui centre la grille dans la fenêtre ou le plein écran"""
+        size = self.fullscreen_size if self.is_fullscreen else self.windowed_size
+        return (size[0] - self.dimension * self.cell_size) // 2
+    
+    @property
+    def offset_y(self) -> int:
+        """Décalage vertical qui centre la grille dans la fenêtre ou le plein écran"""
+        size = self.fullscreen_size if self.is_fullscreen else self.windowed_size
+        return (size[1] - self.dimension * self.cell_size) // 2
+    
     def _generate_base_positions(self):
-        """Génère les positions de base de la grille régulière"""
-        self.base_positions = []
-        for row in range(self.dimension):
-            for col in range(self.dimension):
-                x = col * self.cell_size + self.offset_x
-                y = row * self.cell_size + self.offset_y
-                self.base_positions.append((x, y))
+        """
+        Génère les positions de base de la grille régulière.
+        
+        base_positions est un tableau contigu (N, 2) en ligne par ligne ;
+        base_xs et base_ys en sont des vues par colonne.
+        """
+        rows, cols = np.divmod(np.arange(self.dimension * self.dimension), self.dimension)
+        self.base_positions = np.empty((self.dimension * self.dimension, 2), dtype=np.float64)
+        self.base_positions[:, 0] = cols * self.cell_size + self.offset_x
+        self.base_positions[:, 1] = rows * self.cell_size + self.offset_y
+        self.base_xs = self.base_positions[:, 0]
+        self.base_ys = self.base_positions[:, 1]
     
     def _generate_distortions(self):
-        """Génère les paramètres de distorsion pour chaque carré"""
-        self.distortions = []
-        for i in range(self.dimension * self.dimension):
-            distortion_params = DistortionEngine.generate_distortion_params()
-            self.distortions.append(distortion_params)
+        """Génère les paramètres de distorsion pour chaque carré (un tableau par paramètre)"""
+        self.distortions = DistortionEngine.generate_distortion_params_batch(
+            self.dimension * self.dimension
+        )
     
     def _generate_base_colors(self):
         """Génère les couleurs de base pour chaque carré selon le schéma choisi"""
-        self.base_colors = []
-        
-        for i in range(self.dimension * self.dimension):
-            row = i // self.dimension
-            col = i % self.dimension
-            
-            # Normalisation des coordonnées (0.0 à 1.0)
-            x_norm = col / (self.dimension - 1) if self.dimension > 1 else 0.5
-            y_norm = row / (self.dimension - 1) if self.dimension > 1 else 0.5
-            
-            # Distance au centre normalisée
-            center_x, center_y = 0.5, 0.5
-            distance_to_center = math.sqrt((x_norm - center_x)**2 + (y_norm - center_y)**2)
-            distance_to_center = min(distance_to_center / 0.707, 1.0)  # Normalise à [0,1]
-            
-            color = ColorGenerator.get_color_for_position(
-                self.color_scheme, self.square_color, x_norm, y_norm, 
-                distance_to_center, i, self.dimension
-            )
-            self.base_colors.append(color)
+        # Les sprites en cache dépendent des couleurs et de la taille des cellules
+        self._sprite_cache = ShapeSpriteCache(self.cell_size)
+        sprite_side = 2 * self.cell_size + 4
+        self._animated_sprite_cache = ShapeSpriteCache(
+            self.cell_size,
+            max_entries=self.ANIMATED_SPRITE_CACHE_PIXELS // (sprite_side * sprite_side)
+        )
+        # Tableau (N, 3) mis en cache par ColorGenerator pour chaque schéma
+        self.base_colors_arr = ColorGenerator.get_grid_colors(
+            self.color_scheme, tuple(self.square_color), self.dimension
+        )
+        self.base_colors = [tuple(color) for color in self.base_colors_arr.tolist()]
+        # Tampons réutilisés à chaque frame pour les couleurs animées, exactes
+        # et quantifiées (couleurs des sprites)
+        self.final_colors_arr = np.empty_like(self.base_colors_arr)
+        self._sprite_colors_arr = np.empty_like(self.base_colors_arr)
     
     def _generate_shape_types(self):
         """Génère les types de formes pour chaque cellule selon le mode choisi"""
-        self.shape_types = []
+        cell_count = self.dimension * self.dimension
         
         if self.mixed_shapes:
-            # Mode formes mixtes: assignation aléatoire de différentes formes
-            available_shapes = [shape.value for shape in ShapeType]
-            for i in range(self.dimension * self.dimension):
-                shape_type = random.choice(available_shapes)
-                self.shape_types.append(shape_type)
+            # Mode formes mixtes: un seul tirage vectorisé des codes de forme
+            shape_type_ids = self._random_shape_type_ids(cell_count)
+            self.shape_types = [self._shape_type_values[i] for i in shape_type_ids.tolist()]
         else:
             # Mode forme unique: toutes les cellules ont la même forme
-            for i in range(self.dimension * self.dimension):
-                self.shape_types.append(self.shape_type)
+            self.shape_types = [self.shape_type] * cell_count
+            shape_type_ids = np.full(cell_count, self._shape_type_id(self.shape_type), dtype=np.int8)
+        
+        self._set_shape_type_ids(shape_type_ids)
+    
+    def _shape_type_id(self, shape_type: str) -> int:
+        """
+        Code entier d'un type de forme, indice dans _shape_renderers.
+        Les formes inconnues retombent sur le carré, comme get_shape_renderer_function.
+        """
+        if shape_type in self._shape_type_values:
+            return self._shape_type_values.index(shape_type)
+        return self._shape_type_values.index(ShapeType.SQUARE.value)
+    
+    def _random_shape_type_ids(self, count: int) -> np.ndarray:
+        """Tire count codes de forme uniformément parmi toutes les formes"""
+        return self._shape_rng.integers(
+            0, len(self._shape_type_values), size=count, dtype=np.int8
+        )
+    
+    def _set_shape_type_ids(self, shape_type_ids: np.ndarray):
+        """Enregistre les codes de forme des cellules et les regroupe par forme"""
+        self.shape_type_ids = shape_type_ids
+        
+        # Indices des cellules regroupés par forme, pour dessiner forme par forme
+        self._shape_groups = {
+            int(shape_id): np.flatnonzero(self.shape_type_ids == shape_id)
+            for shape_id in np.unique(self.shape_type_ids)
+        }
     
     def _update_grid_density(self, increase: bool):
         """
@@ -226,28 +380,80 @@ class DeformedGrid:
         old_dimension = self.dimension
         self.dimension = new_dimension
         self.cell_size = new_cell_size
-        
-        # Recalculer les offsets pour centrer la grille
         grid_total_size = self.dimension * self.cell_size
-        self.offset_x = (current_size[0] - grid_total_size) // 2
-        self.offset_y = (current_size[1] - grid_total_size) // 2
         
-        # Régénérer tous les éléments de la grille pour la nouvelle dimension
+        # Les positions et les couleurs dépendent de la taille des cellules ; les
+        # distorsions et les formes des cellules communes aux deux grilles sont conservées
         self._generate_base_positions()
-        self._generate_distortions()
+        self._resize_distortions(old_dimension)
         self._generate_base_colors()
-        self._generate_shape_types()
+        self._resize_shape_types(old_dimension)
         
         direction = "augmentée" if increase else "diminuée"
         print(f"Densité de grille {direction}: {old_dimension}x{old_dimension} → {self.dimension}x{self.dimension}")
         print(f"Taille des cellules: {self.cell_size}px (grille: {grid_total_size}x{grid_total_size}px)")
     
-    def _get_distorted_positions(self) -> List[Tuple[float, float, float]]:
+    def _resize_cell_array(self, values: np.ndarray, old_dimension: int,
+                           new_values_factory) -> np.ndarray:
+        """
+        Adapte un tableau par cellule à la nouvelle dimension de la grille.
+        
+        Les cellules (ligne, colonne) présentes dans les deux grilles gardent leur
+        valeur ; les nouvelles cellules sont remplies par new_values_factory(count).
+        
+        Args:
+            values: Tableau de taille old_dimension², en ligne par ligne
+            old_dimension: Dimension de la grille d'origine
+            new_values_factory: Fonction retournant count nouvelles valeurs
+        
+        Returns:
+            Tableau de taille self.dimension²
+        """
+        old_grid = values.reshape(old_dimension, old_dimension)
+        if self.dimension <= old_dimension:
+            # Réduction : simple découpe des cellules conservées
+            return old_grid[:self.dimension, :self.dimension].ravel()
+        
+        resized = new_values_factory(self.dimension * self.dimension)
+        resized.reshape(self.dimension, self.dimension)[:old_dimension, :old_dimension] = old_grid
+        return resized
+    
+    def _resize_distortions(self, old_dimension: int):
+        """Adapte les paramètres de distorsion à la nouvelle dimension de la grille"""
+        new_distortions = None
+        if self.dimension > old_dimension:
+            new_distortions = DistortionEngine.generate_distortion_params_batch(
+                self.dimension * self.dimension
+            )
+        self.distortions = {
+            name: self._resize_cell_array(
+                values, old_dimension, lambda count, name=name: new_distortions[name]
+            )
+            for name, values in self.distortions.items()
+        }
+    
+    def _resize_shape_types(self, old_dimension: int):
+        """Adapte les formes des cellules à la nouvelle dimension de la grille"""
+        if not self.mixed_shapes:
+            self._generate_shape_types()
+            return
+        
+        shape_type_ids = self._resize_cell_array(
+            self.shape_type_ids, old_dimension,
+            self._random_shape_type_ids
+        )
+        self.shape_types = [self._shape_type_values[i] for i in shape_type_ids.tolist()]
+        self._set_shape_type_ids(shape_type_ids)
+    
+    def _get_distorted_positions(self, out: np.ndarray = None) -> np.ndarray:
         """
         Calcule toutes les positions déformées selon la fonction choisie.
         
+        Args:
+            out: Tampon (N, 3) réutilisé pour le résultat (alloué si None)
+        
         Returns:
-            Liste de tuples (x, y, rotation) pour chaque carré
+            ndarray (N, 3) des (x, y, rotation) de chaque carré
         """
         return DistortionEngine.get_distorted_positions(
             self.base_positions,
@@ -256,7 +462,8 @@ class DeformedGrid:
             self.cell_size,
             self.distortion_strength,
             self.time,
-            self.canvas_size
+            self.canvas_size,
+            out=out
         )
     
     def _draw_shape(self, surface, x: float, y: float, rotation: float, 
@@ -272,12 +479,32 @@ class DeformedGrid:
             color: Couleur RGB de la forme
             shape_type: Type de forme à dessiner
         """
-        # Obtenir la fonction de rendu pour ce type de forme
-        shape_function = get_shape_renderer_function(shape_type)
+        # Fonction de rendu prise dans la table précalculée, par code de forme
+        shape_function = self._shape_renderers[self._shape_type_id(shape_type)]
         
         # Dessiner la forme
         shape_function(surface, x, y, rotation, size, color)
     
+    def _render_text(self, font: pygame.font.Font, text: str,
+                     color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Rend un texte anticrénelé, en réutilisant la surface déjà rendue si possible.
+        
+        Les textes des menus changent rarement d'une frame à l'autre : les
+        surfaces sont gardées dans un cache LRU de TEXT_CACHE_SIZE entrées.
+        """
+        key = (id(font), text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is not None:
+            self._text_cache.move_to_end(key)
+            return text_surface
+        
+        text_surface = font.render(text, True, color)
+        self._text_cache[key] = text_surface
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return text_surface
+    
     def _render_help_menu(self):
         """
         Affiche le menu d'aide par-dessus la grille.
@@ -289,17 +516,60 @@ class DeformedGrid:
         if self.help_font is None or self.help_title_font is None:
             return
         
-        # Créer une surface semi-transparente pour l'arrière-plan
+        # L'aide (fond semi-transparent et texte) ne dépend que de la taille de
+        # l'écran : composée une seule fois, puis copiée en un seul blit
+        # (couleurs prémultipliées par l'alpha)
         current_size = self.screen.get_size()
-        overlay = pygame.Surface(current_size)
-        overlay.set_alpha(200)  # Semi-transparent
-        overlay.fill((0, 0, 0))  # Noir
-        self.screen.blit(overlay, (0, 0))
+        if self._help_surface is None or self._help_surface.get_size() != current_size:
+            self._help_surface = self._compose_help_surface(current_size)
+        self.screen.blit(self._help_surface, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    @staticmethod
+    def _truncate_text(font, text: str, max_width: int, min_length: int = 10) -> str:
+        """
+        Raccourcit text (suivi de "...") pour qu'il tienne dans max_width pixels.
+        
+        Recherche dichotomique du plus long préfixe qui rentre : O(log n) appels
+        à font.size au lieu d'un appel par caractère retiré.
+        
+        Args:
+            font: Police pygame utilisée pour le rendu
+            text: Texte à afficher
+            max_width: Largeur disponible en pixels
+            min_length: Nombre de caractères conservés au minimum
+        
+        Returns:
+            text s'il tient dans la largeur, sinon le préfixe tronqué suivi de "..."
+        """
+        if font.size(text)[0] <= max_width:
+            return text
+        low = min(min_length, len(text))
+        high = len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if font.size(text[:middle] + "...")[0] <= max_width:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low] + "..."
+    
+    def _compose_help_surface(self, current_size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Dessine le menu d'aide (fond semi-transparent et texte) sur une surface.
+        
+        Args:
+            current_size: Taille de l'écran
+        
+        Returns:
+            Surface SRCALPHA de la taille de l'écran
+        """
+        help_surface = pygame.Surface(current_size, pygame.SRCALPHA)
+        help_surface.fill((0, 0, 0, 200))
         
         # Titre du menu d'aide
-        title_text = self.help_title_font.render("AIDE - Contrôles disponibles", True, (255, 255, 255))
+        title_text = self._render_text(self.help_title_font, "AIDE - Contrôles disponibles", (255, 255, 255))
         title_rect = title_text.get_rect(center=(current_size[0] // 2, 50))
-        self.screen.blit(title_text, title_rect)
+        help_surface.blit(title_text, title_rect)
         
         # Définir les contrôles et leurs descriptions
         controls = [
@@ -363,32 +633,27 @@ class DeformedGrid:
                 section_title, section_controls = left_column[i]
                 
                 # Titre de section (gauche)
-                section_text = self.help_title_font.render(section_title, True, (255, 200, 100))
+                section_text = self._render_text(self.help_title_font, section_title, (255, 200, 100))
                 section_x = left_column_x + (column_width - section_text.get_width()) // 2
-                self.screen.blit(section_text, (section_x, current_y_left))
+                help_surface.blit(section_text, (section_x, current_y_left))
                 current_y_left += section_spacing
                 
                 # Contrôles de la section (gauche)
                 for key, description in section_controls:
                     # Afficher la touche en couleur
-                    key_text = self.help_font.render(f"{key}:", True, (100, 255, 100))
+                    key_text = self._render_text(self.help_font, f"{key}:", (100, 255, 100))
                     
                     # Calculer l'espace disponible pour la description
                     available_width = column_width - key_text.get_width() - 20
                     
                     # Tronquer la description si nécessaire
-                    if self.help_font.size(description)[0] > available_width:
-                        # Tronquer progressivement jusqu'à ce que ça rentre
-                        truncated_desc = description
-                        while self.help_font.size(truncated_desc + "...")[0] > available_width and len(truncated_desc) > 10:
-                            truncated_desc = truncated_desc[:-1]
-                        description = truncated_desc + "..."
+                    description = self._truncate_text(self.help_font, description, available_width)
                     
-                    desc_text = self.help_font.render(description, True, (255, 255, 255))
+                    desc_text = self._render_text(self.help_font, description, (255, 255, 255))
                     
                     # Alignement à gauche dans la colonne
-                    self.screen.blit(key_text, (left_column_x, current_y_left))
-                    self.screen.blit(desc_text, (left_column_x + key_text.get_width() + 10, current_y_left))
+                    help_surface.blit(key_text, (left_column_x, current_y_left))
+                    help_surface.blit(desc_text, (left_column_x + key_text.get_width() + 10, current_y_left))
                     current_y_left += line_spacing
             
             # Colonne de droite
@@ -396,41 +661,38 @@ class DeformedGrid:
                 section_title, section_controls = right_column[i]
                 
                 # Titre de section (droite)
-                section_text = self.help_title_font.render(section_title, True, (255, 200, 100))
+                section_text = self._render_text(self.help_title_font, section_title, (255, 200, 100))
                 section_x = right_column_x + (column_width - section_text.get_width()) // 2
-                self.screen.blit(section_text, (section_x, current_y_right))
+                help_surface.blit(section_text, (section_x, current_y_right))
                 current_y_right += section_spacing
                 
                 # Contrôles de la section (droite)
                 for key, description in section_controls:
                     # Afficher la touche en couleur
-                    key_text = self.help_font.render(f"{key}:", True, (100, 255, 100))
+                    key_text = self._render_text(self.help_font, f"{key}:", (100, 255, 100))
                     
                     # Calculer l'espace disponible pour la description
                     available_width = column_width - key_text.get_width() - 20
                     
                     # Tronquer la description si nécessaire
-                    if self.help_font.size(description)[0] > available_width:
-                        # Tronquer progressivement jusqu'à ce que ça rentre
-                        truncated_desc = description
-                        while self.help_font.size(truncated_desc + "...")[0] > available_width and len(truncated_desc) > 10:
-                            truncated_desc = truncated_desc[:-1]
-                        description = truncated_desc + "..."
+                    description = self._truncate_text(self.help_font, description, available_width)
                     
-                    desc_text = self.help_font.render(description, True, (255, 255, 255))
+                    desc_text = self._render_text(self.help_font, description, (255, 255, 255))
                     
                     # Alignement à gauche dans la colonne
-                    self.screen.blit(key_text, (right_column_x, current_y_right))
-                    self.screen.blit(desc_text, (right_column_x + key_text.get_width() + 10, current_y_right))
+                    help_surface.blit(key_text, (right_column_x, current_y_right))
+                    help_surface.blit(desc_text, (right_column_x + key_text.get_width() + 10, current_y_right))
                     current_y_right += line_spacing
             
             # Prendre la plus grande hauteur des deux colonnes pour l'espacement
             y_offset = max(current_y_left, current_y_right) + 15
         
         # Instructions en bas
-        footer_text = self.help_font.render("Appuyez sur 'I' ou TAB pour fermer cette aide", True, (200, 200, 200))
+        footer_text = self._render_text(self.help_font, "Appuyez sur 'I' ou TAB pour fermer cette aide", (200, 200, 200))
         footer_rect = footer_text.get_rect(center=(current_size[0] // 2, current_size[1] - 30))
-        self.screen.blit(footer_text, footer_rect)
+        help_surface.blit(footer_text, footer_rect)
+    
+        return help_surface
     
     def _render_status_display(self):
         """
@@ -462,104 +724,320 @@ class DeformedGrid:
         else:
             status_lines.append(f"Forme: {self.shape_type}")
         if self.is_recording:
-            status_lines.append(f"REC: {len(self.recorded_frames)}f")
+            status_lines.append(f"REC: {self.recorded_frame_count}f")
         
-        # Calculer la position de départ (en haut à droite avec marge)
+        # Le panneau n'est recomposé que lorsque son texte change
+        if status_lines != self._status_lines:
+            self._status_surface = self._compose_status_surface(status_lines)
+            self._status_lines = status_lines
+        
+        # Position en haut à droite avec marge
         margin = 10
+        background_rect = self._status_surface.get_rect(topright=(current_size[0] - margin, margin))
+        self._status_rect = background_rect
+        
+        # Fond semi-transparent et texte en une seule copie (couleurs prémultipliées par l'alpha)
+        self.screen.blit(self._status_surface, background_rect,
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+    
+    def _compose_status_surface(self, status_lines: List[str]) -> pygame.Surface:
+        """
+        Dessine le panneau de statut (fond semi-transparent et texte) sur une surface.
+        
+        Args:
+            status_lines: Lignes de texte à afficher
+        
+        Returns:
+            Surface SRCALPHA du panneau
+        """
         line_height = 22
         max_width = 0
         
-        # Calculer la largeur maximale nécessaire
-        for line in status_lines:
-            text_surface = self.status_font.render(line, True, (255, 255, 255))
+        # Rendre chaque ligne une seule fois et calculer la largeur maximale nécessaire
+        text_surfaces = [
+            self._render_text(self.status_font, line, (255, 255, 255)) for line in status_lines
+        ]
+        for text_surface in text_surfaces:
             max_width = max(max_width, text_surface.get_width())
         
-        # Créer un fond semi-transparent
+        # Fond noir semi-transparent
         background_width = max_width + 20
         background_height = len(status_lines) * line_height + 10
-        background_rect = pygame.Rect(
-            current_size[0] - background_width - margin,
-            margin,
-            background_width,
-            background_height
+        status_surface = pygame.Surface((background_width, background_height), pygame.SRCALPHA)
+        status_surface.fill((0, 0, 0, 128))
+        
+        # Dessiner chaque ligne de texte
+        status_surface.blits(
+            [(text_surface, (10, 5 + i * line_height))
+             for i, text_surface in enumerate(text_surfaces)],
+            doreturn=False
         )
+        return status_surface
+    
+    def _content_rect(self, positions: np.ndarray) -> pygame.Rect:
+        """
+        Rectangle englobant toutes les formes dessinées.
         
-        # Dessiner le fond semi-transparent
-        overlay = pygame.Surface((background_width, background_height))
-        overlay.set_alpha(128)  # Semi-transparent
-        overlay.fill((0, 0, 0))  # Noir
-        self.screen.blit(overlay, background_rect.topleft)
+        Args:
+            positions: ndarray (N, 3) des positions déformées
         
-        # Dessiner chaque ligne de texte
-        start_x = current_size[0] - max_width - margin - 10
-        start_y = margin + 5
+        Returns:
+            Rectangle avec une marge d'une cellule autour des centres des formes
+        """
+        centers = positions[:, :2]
+        centers = centers[np.isfinite(centers).all(axis=1)]
+        if len(centers) == 0:
+            return pygame.Rect(0, 0, 0, 0)
+        
+        margin = self.cell_size + 2
+        min_x, min_y = centers.min(axis=0)
+        max_x, max_y = centers.max(axis=0)
+        return pygame.Rect(
+            int(min_x) - margin,
+            int(min_y) - margin,
+            int(max_x - min_x) + 2 * margin + 1,
+            int(max_y - min_y) + 2 * margin + 1
+        )
+    
+    def _visible_mask(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Indique les cellules dont la forme peut toucher la zone de dessin de l'écran.
+        
+        Args:
+            positions: ndarray (N, 3) des positions déformées
+        
+        Returns:
+            ndarray (N,) de booléens ; False aussi pour les positions NaN/infinies
+        """
+        clip = self.screen.get_clip()
+        margin = self.cell_size + 2
+        xs = positions[:, 0]
+        ys = positions[:, 1]
+        return (
+            (xs >= clip.left - margin) & (xs < clip.right + margin)
+            & (ys >= clip.top - margin) & (ys < clip.bottom + margin)
+        )
+    
+    def _present(self):
+        """
+        Affiche la frame rendue.
         
-        for i, line in enumerate(status_lines):
-            text_surface = self.status_font.render(line, True, (255, 255, 255))
-            y_pos = start_y + i * line_height
-            self.screen.blit(text_surface, (start_x, y_pos))
+        Seules les zones listées dans self._dirty sont envoyées à l'écran ;
+        tout l'écran est mis à jour si aucune zone n'est connue, après un
+        changement de mode d'affichage, ou si les zones couvrent plus de
+        FULL_UPDATE_AREA_RATIO de l'écran (une copie unique est alors plus rapide).
+        """
+        screen_rect = self.screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in self._dirty]
+        dirty_area = sum(rect.width * rect.height for rect in dirty)
+        screen_area = screen_rect.width * screen_rect.height
+        
+        if (self._full_update or not self._dirty
+                or dirty_area > self.FULL_UPDATE_AREA_RATIO * screen_area):
+            pygame.display.update()
+        else:
+            pygame.display.update(dirty)
+        self._dirty = []
+        self._full_update = False
+    
+    def _clear_background(self, changed_rect: pygame.Rect):
+        """
+        Efface les zones de l'écran qui vont être redessinées.
+        
+        Hors des formes (frame actuelle et précédente) et du statut précédent,
+        l'écran contient déjà le fond : seules ces zones sont remplies. Tout
+        l'écran est effacé à la première frame, après un changement de mode
+        d'affichage ou de couleur de fond, et tant que le menu d'aide (qui
+        couvre tout l'écran) est affiché ou vient d'être fermé.
+        
+        Args:
+            changed_rect: Zone couverte par les formes à cette frame et à la précédente
+        """
+        if (self._full_update or self._last_content_rect is None
+                or self.show_help or self._help_visible
+                or self._cleared_background != tuple(self.background_color)):
+            self.screen.fill(self.background_color)
+            self._cleared_background = tuple(self.background_color)
+            return
+        
+        self.screen.fill(self.background_color, changed_rect)
+        if self._last_status_rect is not None:
+            self.screen.fill(self.background_color, self._last_status_rect)
     
     def render(self):
         """Rend la grille déformée sur l'écran"""
-        self.screen.fill(self.background_color)
+        self._render_frame_idx += 1
         
         # Obtenir toutes les positions déformées
-        positions = self._get_distorted_positions()
-        
-        # Dessiner chaque forme déformée avec sa couleur
-        for i, (x, y, rotation) in enumerate(positions):
-            # Obtenir la couleur de base et appliquer l'animation si nécessaire
-            base_color = self.base_colors[i]
-            final_color = ColorGenerator.get_animated_color(
-                base_color, i, self.time, self.color_animation
+        # (le tampon est réalloué par DistortionEngine si la taille de la grille change)
+        distorted_positions = self._get_distorted_positions(out=self._positions_buffer)
+        self._positions_buffer = distorted_positions
+        positions = distorted_positions.tolist()
+        
+        # Seules les zones couvertes par les formes (frame actuelle et précédente) changent
+        # (réunies en un seul rectangle : elles se recouvrent presque entièrement)
+        content_rect = self._content_rect(distorted_positions)
+        if self._last_content_rect is not None:
+            changed_rect = content_rect.union(self._last_content_rect)
+        else:
+            changed_rect = content_rect
+        self._dirty.append(changed_rect)
+        self._clear_background(changed_rect)
+        self._last_content_rect = content_rect
+        
+        # Dessiner les formes groupe par groupe : une seule fonction de rendu par groupe.
+        # Les formes sont des sprites pré-rendus envoyés en un seul appel blits().
+        # Les couleurs animées changent à chaque frame : les sprites utilisent leur
+        # version quantifiée pour que le nombre de sprites distincts reste borné,
+        # le dessin direct (cache plein) les couleurs exactes.
+        if self.color_animation:
+            # Animation des couleurs calculée en un seul appel pour toute la grille
+            ColorGenerator.get_animated_colors(
+                self.base_colors_arr, self.time, out=self.final_colors_arr
             )
-            
-            # Obtenir le type de forme pour cette cellule
-            shape_type = self.shape_types[i]
-            
-            self._draw_shape(self.screen, x, y, rotation, self.cell_size, final_color, shape_type)
-        
-        # Afficher le menu d'aide si activé
+            ColorGenerator.quantize_colors(
+                self.final_colors_arr, self.ANIMATED_COLOR_BITS, out=self._sprite_colors_arr
+            )
+            colors = list(map(tuple, self.final_colors_arr.tolist()))
+            sprite_colors = list(map(tuple, self._sprite_colors_arr.tolist()))
+            sprite_cache = self._animated_sprite_cache
+        else:
+            colors = sprite_colors = self.base_colors
+            sprite_cache = self._sprite_cache
+        # Indices d'angle des sprites, pour toute la grille
+        rotation_bins = sprite_cache.rotation_bins(distorted_positions[:, 2]).tolist()
+        # Les cellules hors de la zone de dessin (ou à position invalide) sont ignorées
+        visible = self._visible_mask(distorted_positions)
+        blit_sequence = []
+        for shape_id, indices in self._shape_groups.items():
+            draw_shape = self._shape_renderers[shape_id]
+            for i in indices[visible[indices]].tolist():
+                x, y, _ = positions[i]
+                rotation_bin = rotation_bins[i]
+                sprite = sprite_cache.get(shape_id, draw_shape, sprite_colors[i], rotation_bin)
+                if sprite is None:
+                    # Cache plein : même angle discrétisé que les sprites voisins
+                    draw_shape(self.screen, x, y, sprite_cache.bin_rotation(rotation_bin),
+                               self.cell_size, colors[i])
+                else:
+                    surface, dx, dy = sprite
+                    blit_sequence.append((surface, (int(x) + dx, int(y) + dy)))
+        if blit_sequence:
+            self.screen.blits(blit_sequence, doreturn=False)
+        
+        # Afficher le menu d'aide si activé. Il couvre tout l'écran : mise à jour
+        # complète tant qu'il est affiché et à la frame qui suit sa fermeture.
+        if self.show_help or self._help_visible:
+            self._full_update = True
+        self._help_visible = self.show_help
         self._render_help_menu()
         
-        # Afficher le statut si activé
+        # Afficher le statut si activé (renseigne self._status_rect)
+        self._status_rect = None
         self._render_status_display()
+        for rect in (self._last_status_rect, self._status_rect):
+            if rect is not None:
+                self._dirty.append(rect)
+        self._last_status_rect = self._status_rect
         
-        pygame.display.flip()
+        self._present()
+        self._frame_drawn = True
+    
+    def _is_static(self) -> bool:
+        """
+        Indique si l'image est figée : sans animation des couleurs, et avec une
+        distorsion nulle ou indépendante du temps, deux frames successives sont
+        identiques.
+        """
+        if self.color_animation:
+            return False
+        if self.distortion_fn in self.TIME_INDEPENDENT_DISTORTIONS:
+            return True
+        return (
+            self.distortion_strength == 0.0
+            and self.distortion_fn not in self.ANIMATED_AT_ZERO_STRENGTH
+        )
+    
+    def _needs_redraw(self) -> bool:
+        """Indique si la frame doit être rendue à nouveau."""
+        return not (self._frame_drawn and self._is_static()) or self.is_recording
     
     def update(self):
         """Met à jour l'animation"""
+        # Image figée déjà affichée : inutile d'avancer le temps
+        if not self._needs_redraw():
+            return
         self.time += self.animation_speed
         
     def start_gif_recording(self):
-        """Démarre l'enregistrement GIF"""
+        """
+        Démarre l'enregistrement GIF.
+        
+        Les frames sont copiées dans un petit nombre de tampons préalloués
+        (GIF_BUFFER_SLOTS) puis réduites et converties en couleurs indexées au fil
+        de l'eau par un thread séparé, qui écrit le GIF à l'arrêt.
+        Si aucun tampon n'est libre, la frame est abandonnée. Un nouvel
+        enregistrement est refusé tant que le GIF précédent s'écrit.
+        """
         if self.is_recording:
             print("⚠️ Enregistrement déjà en cours!")
             return
-            
+        # Ne pas attendre le GIF précédent depuis la boucle de rendu : refuser
+        if self._gif_thread is not None and self._gif_thread.is_alive():
+            print("⚠️ Le GIF précédent est encore en cours d'écriture, réessayez dans un instant")
+            return
+        
+        # Générer un nom de fichier unique dans le dossier 'gifs'
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs("gifs", exist_ok=True)
+        filename = os.path.join("gifs", f"{timestamp}_art_animation.gif")
+        # FPS ajusté selon le frame_skip pour avoir une animation fluide
+        fps = 60 // self.frame_skip if self.frame_skip > 0 else 30
+        fps = min(fps, 20)  # Limiter le FPS pour éviter des GIFs trop rapides
+        
+        width, height = self.screen.get_size()
+        self._gif_slots = np.empty((self.GIF_BUFFER_SLOTS, height, width, 3), dtype=np.uint8)
+        self._gif_free_slots = queue.Queue()
+        for slot in range(self.GIF_BUFFER_SLOTS):
+            self._gif_free_slots.put(slot)
+        self._gif_filled_slots = queue.Queue()
+        # Couleurs ajoutées à la palette du GIF
+        palette_colors = np.concatenate([
+            self.base_colors_arr,
+            np.array([self.background_color], dtype=np.uint8),
+        ])
+        self._gif_thread = threading.Thread(
+            target=self._write_gif_frames,
+            args=(filename, fps, timestamp, self._gif_slots,
+                  self._gif_free_slots, self._gif_filled_slots, palette_colors)
+        )
+        self._gif_thread.start()
+        
         self.is_recording = True
-        self.recorded_frames = []
+        self.recorded_frame_count = 0
+        self.dropped_frame_count = 0
         self.recording_start_time = datetime.datetime.now()
         print(f"🔴 Enregistrement GIF démarré (max {self.max_frames} frames)")
         print("   Appuyez sur 'G' à nouveau pour arrêter et sauvegarder")
     
     def stop_gif_recording(self):
-        """Arrête l'enregistrement et sauvegarde le GIF"""
+        """Arrête l'enregistrement ; le thread d'écriture termine le GIF"""
         if not self.is_recording:
             print("⚠️ Aucun enregistrement en cours!")
             return
             
         self.is_recording = False
+        # Signaler la fin au thread d'écriture, qui finalise le fichier
+        self._gif_filled_slots.put(None)
         
-        if len(self.recorded_frames) == 0:
+        if self.recorded_frame_count == 0:
             print("⚠️ Aucune frame capturée!")
             return
             
-        # Créer le GIF dans un thread séparé pour éviter de bloquer l'UI
-        thread = threading.Thread(target=self._save_gif_async)
-        thread.start()
-        print(f"🟡 Arrêt de l'enregistrement ({len(self.recorded_frames)} frames)")
-        print("   Création du GIF en cours...")
+        print(f"🟡 Arrêt de l'enregistrement ({self.recorded_frame_count} frames)")
+        if self.dropped_frame_count:
+            print(f"   {self.dropped_frame_count} frames abandonnées (écriture du GIF trop lente)")
+        print("   Finalisation du GIF en cours...")
     
     def _capture_frame(self):
         """Capture la frame actuelle pour l'enregistrement GIF"""
@@ -567,70 +1045,331 @@ class DeformedGrid:
             return
             
         # Éviter de capturer trop de frames
-        if len(self.recorded_frames) >= self.max_frames:
+        if self.recorded_frame_count >= self.max_frames:
             print(f"⚠️ Limite de frames atteinte ({self.max_frames}), arrêt auto...")
             self.stop_gif_recording()
             return
             
-        # Capturer chaque N-ième frame selon frame_skip
-        frame_count = len(self.recorded_frames)
-        if frame_count % self.frame_skip == 0:
-            # Convertir la surface pygame en array numpy
-            surface_array = pygame.surfarray.array3d(self.screen)
-            # Pygame utilise (width, height, channels), nous devons transposer en (height, width, channels)
-            frame_array = np.transpose(surface_array, (1, 0, 2))
-            self.recorded_frames.append(frame_array)
-    
-    def _save_gif_async(self):
-        """Sauvegarde le GIF de façon asynchrone"""
+        # Capturer chaque N-ième frame rendue selon frame_skip
+        if self._render_frame_idx % self.frame_skip == 0:
+            # Le GIF garde la taille du début de l'enregistrement
+            if self.screen.get_size() != self._gif_slots.shape[2:0:-1]:
+                return
+            # Tous les tampons attendent l'écriture : la frame est abandonnée
+            # plutôt que de bloquer la boucle de rendu
+            try:
+                slot = self._gif_free_slots.get_nowait()
+            except queue.Empty:
+                self.dropped_frame_count += 1
+                return
+            # Vue directe sur les pixels (width, height, channels), copiée une seule
+            # fois dans le tampon (height, width, channels). Les surfaces 8/16 bits
+            # n'ont pas de vue directe : copie via array3d.
+            try:
+                pixels = pygame.surfarray.pixels3d(self.screen)
+            except ValueError:
+                pixels = pygame.surfarray.array3d(self.screen)
+            np.copyto(self._gif_slots[slot], pixels.swapaxes(0, 1))
+            del pixels  # Déverrouille la surface
+            self._gif_filled_slots.put(slot)
+            self.recorded_frame_count += 1
+    
+    def _write_gif_frames(self, filename: str, fps: int, timestamp: str, slots: np.ndarray,
+                          free_slots: queue.Queue, filled_slots: queue.Queue,
+                          palette_colors: np.ndarray):
+        """
+        Boucle du thread d'écriture : convertit chaque frame reçue en couleurs
+        indexées et l'ajoute aussitôt au fichier GIF.
+        
+        Toutes les frames partagent une palette de 256 couleurs calculée une seule
+        fois sur la première frame (voir _build_gif_palette) et écrite comme table
+        de couleurs globale : chaque frame est encodée puis écrite dès sa
+        réception, sans être gardée en mémoire (seule la frame précédente est
+        conservée, pour n'écrire que les pixels qui ont changé, voir
+        _gif_frame_patch). Les tampons sont rendus à
+        free_slots dès que leur frame est écrite ; None dans filled_slots termine
+        l'enregistrement. Une frame qui ne peut pas être ajoutée au GIF est
+        sauvegardée en PNG.
+        """
+        gif_file = None
+        palette_image = None
+        previous_indices = None  # Indices de couleur de la dernière frame écrite
+        frame_duration = 1000 / fps
+        frame_count = 0
+        saved_frame_count = 0  # Frames sauvegardées individuellement (fallback)
         try:
-            
-            # Générer un nom de fichier unique
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{timestamp}_art_animation.gif"
-            # Créer le dossier 'gifs' s'il n'existe pas
-            gif_folder = "gifs"
-            if not os.path.exists(gif_folder):
-                os.makedirs(gif_folder)
-            filename = os.path.join(gif_folder, filename)
-            # Créer le GIF avec imageio
-            # FPS ajusté selon le frame_skip pour avoir une animation fluide
-            fps = 60 // self.frame_skip if self.frame_skip > 0 else 30
-            fps = min(fps, 20)  # Limiter le FPS pour éviter des GIFs trop rapides
-            
-            imageio.mimsave(filename, self.recorded_frames, fps=fps, loop=0)
-            
-            duration = len(self.recorded_frames) / fps
+            while True:
+                slot = filled_slots.get()
+                if slot is None:
+                    break
+                frame = self._downscale_frame(slots[slot], self.GIF_DOWNSCALE)
+                try:
+                    if gif_file is None:
+                        palette_image = self._build_gif_palette(frame, palette_colors)
+                        header = self._gif_header(palette_image, frame.shape[1], frame.shape[0])
+                        gif_file = open(filename, "wb")
+                        gif_file.writelines(header)
+                    indexed = Image.fromarray(frame).quantize(
+                        palette=palette_image, dither=Image.Dither.NONE
+                    )
+                    indices = np.asarray(indexed)
+                    patch, offset = self._gif_frame_patch(previous_indices, indices)
+                    patch_image = Image.frombytes(
+                        "P", (patch.shape[1], patch.shape[0]), np.ascontiguousarray(patch)
+                    )
+                    patch_image.putpalette(palette_image.getpalette())
+                    # Frame encodée entièrement avant d'être écrite
+                    gif_file.writelines(GifImagePlugin.getdata(
+                        patch_image, offset=offset, duration=frame_duration, disposal=1,
+                        transparency=self.GIF_TRANSPARENT_INDEX
+                    ))
+                    gif_file.flush()
+                    previous_indices = indices
+                    frame_count += 1
+                except Exception as e:
+                    print(f"❌ Erreur lors de la création du GIF: {e}")
+                    # Fallback: sauvegarder la frame individuellement
+                    self._save_frame_as_image(frame, timestamp, frame_count + saved_frame_count)
+                    saved_frame_count += 1
+                free_slots.put(slot)
+        finally:
+            if gif_file is not None:
+                gif_file.write(b";")  # Fin du fichier GIF
+                gif_file.close()
+        
+        if frame_count:
+            duration = frame_count / fps
             print(f"✅ GIF sauvegardé: {filename}")
-            print(f"   📊 {len(self.recorded_frames)} frames, {duration:.1f}s, {fps} FPS")
-            
-        except ImportError:
-            print("❌ Erreur: imageio non installé!")
-            print("   Installez avec: pip install imageio")
-            # Fallback: sauvegarder les frames individuellement
-            self._save_frames_as_images()
-        except Exception as e:
-            print(f"❌ Erreur lors de la création du GIF: {e}")
-            self._save_frames_as_images()
+            print(f"   📊 {frame_count} frames, {duration:.1f}s, {fps} FPS")
+        if saved_frame_count:
+            print(f"✅ Frames sauvegardées: frame_{timestamp}_0000.png à frame_{timestamp}_{saved_frame_count-1:04d}.png")
     
-    def _save_frames_as_images(self):
-        """Sauvegarde les frames comme images individuelles (fallback)"""
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        print(f"💾 Sauvegarde de {len(self.recorded_frames)} frames individuelles...")
-        
-        for i, frame in enumerate(self.recorded_frames):
-            filename = f"frame_{timestamp}_{i:04d}.png"
-            # Convertir numpy array vers surface pygame puis sauvegarder
-            frame_transposed = np.transpose(frame, (1, 0, 2))
-            surface = pygame.surfarray.make_surface(frame_transposed)
-            pygame.image.save(surface, filename)
-            
-        print(f"✅ Frames sauvegardées: frame_{timestamp}_0000.png à frame_{timestamp}_{len(self.recorded_frames)-1:04d}.png")
+    @classmethod
+    def _gif_frame_patch(cls, previous: np.ndarray,
+                         current: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        Partie d'une frame indexée à écrire dans le GIF par-dessus la précédente.
+        
+        Seul le rectangle englobant les pixels modifiés est écrit ; les pixels
+        inchangés de ce rectangle prennent l'indice transparent, ce qui laisse
+        voir la frame précédente et se compresse bien.
+        
+        Args:
+            previous: Indices (height, width) de la frame précédente, ou None
+            current: Indices (height, width) de la frame à écrire
+        
+        Returns:
+            (indices du rectangle, (x, y) de son coin supérieur gauche) ; toute la
+            frame s'il n'y a pas de frame précédente, un pixel transparent si
+            rien n'a changé
+        """
+        if previous is None:
+            return current, (0, 0)
+        changed = previous != current
+        rows = np.flatnonzero(changed.any(axis=1))
+        if len(rows) == 0:
+            return np.full((1, 1), cls.GIF_TRANSPARENT_INDEX, dtype=np.uint8), (0, 0)
+        cols = np.flatnonzero(changed.any(axis=0))
+        top, bottom = rows[0], rows[-1] + 1
+        left, right = cols[0], cols[-1] + 1
+        patch = np.where(changed[top:bottom, left:right], current[top:bottom, left:right],
+                         np.uint8(cls.GIF_TRANSPARENT_INDEX))
+        return patch, (int(left), int(top))
+    
+    @staticmethod
+    def _gif_header(palette_image: Image.Image, width: int, height: int) -> List[bytes]:
+        """
+        En-tête d'un GIF animé en boucle de taille width×height, avec la palette
+        de palette_image comme table de couleurs globale.
+        """
+        screen = Image.new("P", (width, height))
+        screen.putpalette(palette_image.getpalette())
+        header, _ = GifImagePlugin.getheader(screen, info={"loop": 0})
+        return header
+    
+    @staticmethod
+    def _build_gif_palette(frame: np.ndarray, palette_colors: np.ndarray) -> Image.Image:
+        """
+        Calcule la palette commune du GIF.
+        
+        Args:
+            frame: Première frame enregistrée (height, width, 3) uint8
+            palette_colors: Couleurs (K, 3) uint8 que la grille peut afficher
+                (couleurs de base et fond), ajoutées même si absentes de la frame
+        
+        Returns:
+            Image en mode "P" dont la palette sert aux autres frames ; elle a au
+            plus 255 couleurs, l'indice GIF_TRANSPARENT_INDEX restant libre
+        """
+        samples = np.concatenate([frame.reshape(-1, 3), palette_colors])
+        return Image.fromarray(samples.reshape(1, -1, 3)).quantize(
+            colors=DeformedGrid.GIF_TRANSPARENT_INDEX, method=Image.Quantize.MEDIANCUT
+        )
+    
+    @staticmethod
+    def _downscale_frame(frame: np.ndarray, factor: int) -> np.ndarray:
+        """
+        Réduit une frame (height, width, 3) par moyenne de blocs factor×factor.
+        
+        Exécuté par le thread d'écriture : l'encodage du GIF, proportionnel au
+        nombre de pixels, traite factor² fois moins de données. Le noyau Numba
+        (voir frame_kernels) libère le GIL pendant la réduction.
+        
+        Args:
+            frame: Frame uint8 (height, width, 3)
+            factor: Facteur de réduction (1 : frame inchangée)
+        
+        Returns:
+            Frame uint8 (height // factor, width // factor, 3)
+        """
+        height = frame.shape[0] // factor * factor
+        width = frame.shape[1] // factor * factor
+        if factor <= 1 or height == 0 or width == 0:
+            return frame
+        if frame_kernels.NUMBA_AVAILABLE:
+            small = np.empty((height // factor, width // factor, 3), dtype=np.uint8)
+            frame_kernels.downscale_frame(frame, factor, small)
+            return small
+        blocks = frame[:height, :width].reshape(
+            height // factor, factor, width // factor, factor, 3
+        )
+        sums = blocks.sum(axis=(1, 3), dtype=np.uint16)
+        sums += (factor * factor) // 2  # Arrondi au plus proche
+        sums //= factor * factor
+        return sums.astype(np.uint8)
+    
+    def _save_frame_as_image(self, frame: np.ndarray, timestamp: str, index: int):
+        """Sauvegarde une frame comme image individuelle (fallback)"""
+        filename = f"frame_{timestamp}_{index:04d}.png"
+        # La frame est déjà en (height, width, 3) : écriture directe, sans surface pygame
+        imageio.imwrite(filename, frame)
 
+    @staticmethod
+    def _step_value(values: tuple, current: str, backward: bool) -> str:
+        """Retourne la valeur suivante (ou précédente) de current dans values, en boucle"""
+        index = values.index(current) if current in values else 0
+        return values[(index + (-1 if backward else 1)) % len(values)]
+    
+    def _on_quit_key(self, shift: bool, ctrl: bool):
+        """ESC: quitter"""
+        self._running = False
+    
+    def _on_help_key(self, shift: bool, ctrl: bool):
+        """I (pour "Info") ou Tab (facile d'accès): afficher/masquer l'aide"""
+        self.show_help = not self.show_help
+        status = "affiché" if self.show_help else "masqué"
+        print(f"Menu d'aide: {status}")
+    
+    def _on_status_key(self, shift: bool, ctrl: bool):
+        """D: basculer l'affichage du statut"""
+        self.show_status = not self.show_status
+        status = "affiché" if self.show_status else "masqué"
+        print(f"Affichage du statut: {status}")
+    
+    def _on_distortion_key(self, shift: bool, ctrl: bool):
+        """SPACE/Shift+SPACE: type de distorsion suivant/précédent"""
+        self.distortion_fn = self._step_value(self._distortion_type_values, self.distortion_fn, shift)
+        direction = "←" if shift else "→"
+        print(f"Distorsion {direction}: {self.distortion_fn}")
+    
+    def _on_color_key(self, shift: bool, ctrl: bool):
+        """C/Shift+C: schéma de couleurs suivant/précédent"""
+        self.color_scheme = self._step_value(self._color_scheme_values, self.color_scheme, shift)
+        self._generate_base_colors()  # Régénérer les couleurs
+        direction = "←" if shift else "→"
+        print(f"Couleurs {direction}: {self.color_scheme}")
+    
+    def _on_color_animation_key(self, shift: bool, ctrl: bool):
+        """A: activer/désactiver l'animation des couleurs"""
+        self.color_animation = not self.color_animation
+        status = "activée" if self.color_animation else "désactivée"
+        print(f"Animation des couleurs: {status}")
+    
+    def _on_density_mode_key(self, shift: bool, ctrl: bool):
+        """T: basculer le mode d'ajustement de la densité de grille"""
+        self.grid_density_mode = not self.grid_density_mode
+        mode_text = "activé" if self.grid_density_mode else "désactivé"
+        action_text = "Utilisez +/- pour ajuster" if self.grid_density_mode else ""
+        print(f"Mode ajustement densité de grille: {mode_text} {action_text}")
+    
+    def _on_plus_key(self, shift: bool, ctrl: bool):
+        """+: plus de cellules en mode densité, sinon plus de distorsion"""
+        if self.grid_density_mode:
+            self._update_grid_density(increase=True)
+        else:
+            self._set_distortion_strength(0.1)
+    
+    def _on_minus_key(self, shift: bool, ctrl: bool):
+        """-: moins de cellules en mode densité, sinon moins de distorsion"""
+        if self.grid_density_mode:
+            self._update_grid_density(increase=False)
+        else:
+            self._set_distortion_strength(-0.1)
+    
+    def _set_distortion_strength(self, delta: float):
+        """
+        Ajoute delta à l'intensité de distorsion, bornée à [0, 1].
+        
+        Rien n'est modifié ni affiché si l'intensité est déjà à la borne.
+        """
+        strength = min(1.0, max(0.0, self.distortion_strength + delta))
+        if strength == self.distortion_strength:
+            return
+        self.distortion_strength = strength
+        self.base_distortion_strength = strength
+        print(f"Intensité: {self.distortion_strength:.1f}")
+    
+    def _on_regenerate_key(self, shift: bool, ctrl: bool):
+        """R: régénérer les paramètres aléatoires"""
+        self._generate_distortions()
+        self._generate_base_colors()
+        self._generate_shape_types()
+        print("Paramètres régénérés")
+    
+    def _on_save_key(self, shift: bool, ctrl: bool):
+        """S: sauvegarder l'image et ses paramètres"""
+        self.save_image(f"deformed_grid_{self.distortion_fn}_{int(self.time*100)}.png")
+    
+    def _on_shape_key(self, shift: bool, ctrl: bool):
+        """H/Shift+H: forme suivante/précédente ; Ctrl+H: basculer le mode formes mixtes"""
+        if ctrl:
+            self.mixed_shapes = not self.mixed_shapes
+            self._generate_shape_types()  # Régénérer les formes
+            mode = "formes mixtes" if self.mixed_shapes else "forme unique"
+            print(f"Mode: {mode} ({self.shape_type})")
+            return
+        
+        self.shape_type = self._step_value(self._shape_type_values, self.shape_type, shift)
+        self._generate_shape_types()  # Régénérer les formes
+        direction = "←" if shift else "→"
+        print(f"Forme {direction}: {self.shape_type}")
+    
+    def _on_fullscreen_key(self, shift: bool, ctrl: bool):
+        """F: basculer plein écran"""
+        self.toggle_fullscreen()
+        mode = "plein écran" if self.is_fullscreen else "fenêtré"
+        print(f"Mode: {mode}")
+    
+    def _on_gif_key(self, shift: bool, ctrl: bool):
+        """G: démarrer/arrêter l'enregistrement GIF"""
+        if self.is_recording:
+            self.stop_gif_recording()
+        else:
+            self.start_gif_recording()
+    
+    def _on_scene_key(self, shift: bool, ctrl: bool):
+        """L/Shift+L: scène sauvegardée suivante/précédente"""
+        if shift:
+            self.load_previous_scene()
+        else:
+            self.load_next_scene()
+    
+    def _on_refresh_scenes_key(self, shift: bool, ctrl: bool):
+        """P: actualiser la liste des scènes sauvegardées"""
+        self.refresh_saved_scenes()
+    
     def run_interactive(self):
         """Lance la boucle interactive principale"""
-        running = True
-        
         print("Contrôles:")
         print("- ESC: Quitter")
         print("- I ou TAB: Afficher/masquer l'aide complète")
@@ -649,184 +1388,142 @@ class DeformedGrid:
         print("- L/Shift+L: Scène suivante/précédente")
         print("💡 Utilisez Shift pour naviguer dans le sens inverse!")
         
-        distortion_types = [t.value for t in DistortionType]
-        current_distortion_index = 0
+        # Compiler les noyaux Numba avant la première frame plutôt qu'au milieu
+        # de l'animation (au premier passage sur une distorsion compilée)
+        distortion_kernels.warm_up()
+        color_kernels.warm_up()
+        frame_kernels.warm_up()
         
-        color_schemes = [c.value for c in ColorScheme]
-        current_color_index = 0
-        # Trouver l'index actuel du schéma de couleur
+        self._running = True
         try:
-            current_color_index = color_schemes.index(self.color_scheme)
-        except ValueError:
-            current_color_index = 0
-        
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    elif event.key == pygame.K_i:
-                        # I pour "Info" - aide
-                        self.show_help = not self.show_help
-                        status = "affiché" if self.show_help else "masqué"
-                        print(f"Menu d'aide: {status}")
-                    elif event.key == pygame.K_TAB:
-                        # Tab comme alternative pour l'aide (facile d'accès)
-                        self.show_help = not self.show_help
-                        status = "affiché" if self.show_help else "masqué"
-                        print(f"Menu d'aide: {status}")
-                    elif event.key == pygame.K_d:
-                        # D pour basculer l'affichage du statut
-                        self.show_status = not self.show_status
-                        status = "affiché" if self.show_status else "masqué"
-                        print(f"Affichage du statut: {status}")
-                    elif event.key == pygame.K_SPACE:
-                        # Navigation dans les types de distorsion
-                        if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT]:
-                            # Shift+SPACE: type de distorsion précédent
-                            current_distortion_index = (current_distortion_index - 1) % len(distortion_types)
-                        else:
-                            # SPACE: type de distorsion suivant
-                            current_distortion_index = (current_distortion_index + 1) % len(distortion_types)
-                        self.distortion_fn = distortion_types[current_distortion_index]
-                        direction = "←" if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT] else "→"
-                        print(f"Distorsion {direction}: {self.distortion_fn}")
-                    elif event.key == pygame.K_c:
-                        # Navigation dans les schémas de couleurs
-                        if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT]:
-                            # Shift+C: schéma de couleurs précédent
-                            current_color_index = (current_color_index - 1) % len(color_schemes)
-                        else:
-                            # C: schéma de couleurs suivant
-                            current_color_index = (current_color_index + 1) % len(color_schemes)
-                        self.color_scheme = color_schemes[current_color_index]
-                        self._generate_base_colors()  # Régénérer les couleurs
-                        direction = "←" if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT] else "→"
-                        print(f"Couleurs {direction}: {self.color_scheme}")
-                    elif event.key == pygame.K_a:
-                        # Activer/désactiver l'animation des couleurs
-                        self.color_animation = not self.color_animation
-                        status = "activée" if self.color_animation else "désactivée"
-                        print(f"Animation des couleurs: {status}")
-
-                    elif event.key == pygame.K_t:
-                        # Basculer le mode d'ajustement de la densité de grille
-                        self.grid_density_mode = not self.grid_density_mode
-                        mode_text = "activé" if self.grid_density_mode else "désactivé"
-                        action_text = "Utilisez +/- pour ajuster" if self.grid_density_mode else ""
-                        print(f"Mode ajustement densité de grille: {mode_text} {action_text}")
-                    elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
-                        if self.grid_density_mode:
-                            # Augmenter la densité de grille (plus de cellules)
-                            self._update_grid_density(increase=True)
-                        else:
-                            # Augmenter l'intensité de distorsion
-                            self.distortion_strength = min(1.0, self.distortion_strength + 0.1)
-                            self.base_distortion_strength = self.distortion_strength
-                            print(f"Intensité: {self.distortion_strength:.1f}")
-                    elif event.key == pygame.K_MINUS:
-                        if self.grid_density_mode:
-                            # Diminuer la densité de grille (moins de cellules)
-                            self._update_grid_density(increase=False)
-                        else:
-                            # Diminuer l'intensité de distorsion
-                            self.distortion_strength = max(0.0, self.distortion_strength - 0.1)
-                            self.base_distortion_strength = self.distortion_strength
-                            print(f"Intensité: {self.distortion_strength:.1f}")
-                    elif event.key == pygame.K_r:
-                        # Régénérer les paramètres
-                        self._generate_distortions()
-                        self._generate_base_colors()
-                        self._generate_shape_types()
-                        print("Paramètres régénérés")
-                    elif event.key == pygame.K_s:
-                        # Sauvegarder
-                        self.save_image(f"deformed_grid_{self.distortion_fn}_{int(self.time*100)}.png")
-                        print("Image sauvegardée")
-                    elif event.key == pygame.K_h and (pygame.key.get_pressed()[pygame.K_LCTRL] or pygame.key.get_pressed()[pygame.K_RCTRL]):
-                        # Basculer le mode formes mixtes (Ctrl+H)
-                        self.mixed_shapes = not self.mixed_shapes
-                        self._generate_shape_types()  # Régénérer les formes
-                        mode = "formes mixtes" if self.mixed_shapes else "forme unique"
-                        print(f"Mode: {mode} ({self.shape_type})")
-                    elif event.key == pygame.K_h:
-                        # Navigation dans les types de formes
-                        shape_types = [s.value for s in ShapeType]
-                        current_shape_index = shape_types.index(self.shape_type) if self.shape_type in shape_types else 0
-                        
-                        if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT]:
-                            # Shift+H: type de forme précédent
-                            current_shape_index = (current_shape_index - 1) % len(shape_types)
-                        else:
-                            # H: type de forme suivant
-                            current_shape_index = (current_shape_index + 1) % len(shape_types)
-                        
-                        self.shape_type = shape_types[current_shape_index]
-                        self._generate_shape_types()  # Régénérer les formes
-                        direction = "←" if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT] else "→"
-                        print(f"Forme {direction}: {self.shape_type}")
-                    elif event.key == pygame.K_f:
-                        # Basculer plein écran
-                        self.toggle_fullscreen()
-                        mode = "plein écran" if self.is_fullscreen else "fenêtré"
-                        print(f"Mode: {mode}")
-                    elif event.key == pygame.K_g:
-                        # Basculer l'enregistrement GIF
-                        if self.is_recording:
-                            self.stop_gif_recording()
-                        else:
-                            self.start_gif_recording()
-                    elif event.key == pygame.K_l:
-                        # Navigation dans les scènes sauvegardées
-                        if pygame.key.get_pressed()[pygame.K_LSHIFT] or pygame.key.get_pressed()[pygame.K_RSHIFT]:
-                            # Shift+L: scène précédente
-                            self.load_previous_scene()
-                        else:
-                            # L: scène suivante
-                            self.load_next_scene()
-                    elif event.key == pygame.K_p:
-                        # Actualiser la liste des scènes sauvegardées
-                        self.refresh_saved_scenes()
-            
-            self.update()
-            self.render()
-            
-            # Capturer la frame pour l'enregistrement GIF si actif
-            self._capture_frame()
-            
-            self.clock.tick(60)  # 60 FPS
-        
+            while self._running:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self._running = False
+                    elif event.type == pygame.VIDEOEXPOSE:
+                        self._frame_drawn = False
+                    elif event.type == pygame.KEYDOWN:
+                        # Toute touche peut changer l'image : la redessiner
+                        self._frame_drawn = False
+                        handler = self._key_handlers.get(event.key)
+                        if handler is not None:
+                            # Modificateurs lus une seule fois sur l'événement
+                            handler(bool(event.mod & pygame.KMOD_SHIFT),
+                                    bool(event.mod & pygame.KMOD_CTRL))
+                
+                self.update()
+                if self._needs_redraw():
+                    self.render()
+                
+                # Capturer la frame pour l'enregistrement GIF si actif
+                self._capture_frame()
+                
+                if self.is_recording:
+                    # Attente active : cadence régulière des frames capturées pour le GIF
+                    self.clock.tick_busy_loop(60)
+                else:
+                    self.clock.tick(60)  # 60 FPS
+        finally:
+            # Y compris sur exception : finir le GIF et les sauvegardes en cours
+            self.close()
+            pygame.quit()
+    
+    def close(self):
+        """
+        Termine les écritures en arrière-plan : arrête l'enregistrement GIF en
+        cours, attend la fin de l'écriture du GIF puis celle des sauvegardes (S).
+        Peut être appelée plusieurs fois.
+        """
         # Auto-sauvegarder le GIF si un enregistrement est en cours
         if self.is_recording:
             print("\n🟡 Fermeture de l'application - sauvegarde automatique du GIF...")
             self.stop_gif_recording()
-            # Attendre un peu pour permettre au thread de se terminer
-            import time
-            time.sleep(2)
         
-        pygame.quit()
+        # Attendre la fin de l'écriture du GIF (l'encodage de 900 frames
+        # peut dépasser quelques secondes), y compris après un arrêt par G,
+        # sans bloquer indéfiniment la fermeture si le thread est bloqué
+        if self._gif_thread is not None:
+            self._gif_thread.join(timeout=30)
+            if self._gif_thread.is_alive():
+                print("⚠️ Le GIF est toujours en cours d'écriture après 30 s, fermeture sans attendre")
+            self._gif_thread = None
+        
+        # Terminer l'écriture des captures d'écran en cours
+        if self._save_pool is not None:
+            self._save_pool.shutdown(wait=True)
+            self._save_pool = None
+    
+    def _get_save_pool(self) -> ThreadPoolExecutor:
+        """Retourne le thread de sauvegarde, créé à la première sauvegarde"""
+        if self._save_pool is None:
+            self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-save")
+        return self._save_pool
+    
+    @staticmethod
+    def _set_display_mode(size: Tuple[int, int], flags: int = 0) -> pygame.Surface:
+        """
+        Ouvre la fenêtre avec le rendu accéléré de SDL (SCALED, double tampon)
+        et la synchronisation verticale si possible.
+        
+        Sans vsync, puis sans rendu accéléré (pilote logiciel, serveur sans GPU),
+        la fenêtre est ouverte avec les seuls flags demandés.
+        
+        Args:
+            size: Taille de la fenêtre
+            flags: Flags pygame supplémentaires (FULLSCREEN...)
+        
+        Returns:
+            Surface de l'écran
+        """
+        accelerated = flags | pygame.SCALED | pygame.DOUBLEBUF
+        try:
+            return pygame.display.set_mode(size, accelerated, vsync=1)
+        except pygame.error:
+            pass
+        try:
+            return pygame.display.set_mode(size, accelerated)
+        except pygame.error:
+            return pygame.display.set_mode(size, flags)
     
     def toggle_fullscreen(self):
         """Basculer entre mode fenêtré et plein écran"""
+        old_offsets = (self.offset_x, self.offset_y)
         self.is_fullscreen = not self.is_fullscreen
+        self._full_update = True
+        old_pixel_format = (self.screen.get_bitsize(), self.screen.get_masks())
         
         if self.is_fullscreen:
             # Passer en plein écran
-            self.screen = pygame.display.set_mode(self.fullscreen_size, pygame.FULLSCREEN)
+            self.screen = self._set_display_mode(self.fullscreen_size, pygame.FULLSCREEN)
         else:
             # Retour au mode fenêtré
-            self.screen = pygame.display.set_mode(self.windowed_size)
+            self.screen = self._set_display_mode(self.windowed_size)
         
-        # Recalculer les offsets pour centrer la grille avec la taille d'écran appropriée
-        current_size = self.fullscreen_size if self.is_fullscreen else self.windowed_size
-        grid_total_size = self.dimension * self.cell_size
-        self.offset_x = (current_size[0] - grid_total_size) // 2
-        self.offset_y = (current_size[1] - grid_total_size) // 2
+        # Les sprites sont convertis au format de l'écran : les refaire s'il a changé
+        if (self.screen.get_bitsize(), self.screen.get_masks()) != old_pixel_format:
+            self._sprite_cache.clear()
+            self._animated_sprite_cache.clear()
         
-        # Recalculer les positions de base avec les nouveaux offsets
-        self._generate_base_positions()
+        # Les offsets suivent la taille d'écran : décaler les positions de base
+        # en place plutôt que de les régénérer
+        self.base_xs += self.offset_x - old_offsets[0]
+        self.base_ys += self.offset_y - old_offsets[1]
+    
+    def _resize_window(self, size: Tuple[int, int]):
+        """
+        Change la taille de la fenêtre ; en plein écran, elle est appliquée
+        au retour en mode fenêtré.
+        """
+        self.windowed_size = size
+        if self.is_fullscreen:
+            return
+        old_pixel_format = (self.screen.get_bitsize(), self.screen.get_masks())
+        self.screen = self._set_display_mode(size)
+        self._full_update = True
+        # Les sprites sont convertis au format de l'écran : les refaire s'il a changé
+        if (self.screen.get_bitsize(), self.screen.get_masks()) != old_pixel_format:
+            self._sprite_cache.clear()
+            self._animated_sprite_cache.clear()
     
     def save_image(self, filename: str):
         """Sauvegarde l'image actuelle avec ses paramètres"""
@@ -835,19 +1532,42 @@ class DeformedGrid:
         os.makedirs("images", exist_ok=True)
         os.makedirs("saved_params", exist_ok=True)
         
-        # Save the image
+        # Copy the pixels now, encode the PNG on the save thread
         image_path = os.path.join("images", filename)
-        pygame.image.save(self.screen, image_path)
-        
-        # Save the parameters in YAML format
+        width, height = self.screen.get_size()
+        pixels = np.frombuffer(
+            pygame.image.tobytes(self.screen, "RGB"), dtype=np.uint8
+        ).reshape(height, width, 3)
+        save_pool = self._get_save_pool()
+        save_pool.submit(self._write_image, pixels, image_path)
+        
+        # Save the parameters in YAML format: snapshot now, dump on the save thread
         base_name = os.path.splitext(filename)[0]  # Remove extension
         param_filename = f"{base_name}.yaml"
         param_path = os.path.join("saved_params", param_filename)
         
-        self.save_parameters(param_path)
+        params = self.get_current_parameters()
+        params["saved_filename"] = param_filename
+        self._pending_scene_writes[param_path] = save_pool.submit(
+            self._write_parameters, params, param_path
+        )
         
+        # Ajouter la nouvelle scène à la liste en cours plutôt que de relire le dossier.
+        # Ses paramètres sont mis en cache : elle peut être chargée avant la fin de
+        # l'écriture du YAML par le thread de sauvegarde.
+        self._scene_cache[param_path] = params
+        if self.scene_iteration_mode and param_path not in self.saved_scenes:
+            self.saved_scenes.append(param_path)
+    
+    def _write_image(self, pixels: np.ndarray, image_path: str):
+        """Encode et écrit une capture d'écran (exécuté par le thread de sauvegarde)"""
+        try:
+            # Compression rapide : la capture doit être prête sans attendre
+            imageio.imwrite(image_path, pixels, compress_level=1)
+        except Exception as e:
+            print(f"❌ Erreur lors de la sauvegarde de l'image: {e}")
+            return
         print(f"Image sauvegardée: {image_path}")
-        print(f"Paramètres sauvegardés: {param_path}")
     
     def get_current_parameters(self) -> dict:
         """Retourne tous les paramètres actuels de la grille"""
@@ -892,19 +1612,40 @@ class DeformedGrid:
         """Sauvegarde les paramètres actuels dans un fichier YAML"""
         params = self.get_current_parameters()
         params["saved_filename"] = os.path.basename(filepath)
+        self._scene_cache.pop(filepath, None)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(params, f, default_flow_style=False, indent=2, allow_unicode=True)
+            yaml.dump(params, f, Dumper=SafeDumper, default_flow_style=False, indent=2,
+                      allow_unicode=True)
+    
+    def _write_parameters(self, params: dict, filepath: str):
+        """Écrit les paramètres d'une capture en YAML (exécuté par le thread de sauvegarde)"""
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                yaml.dump(params, f, Dumper=SafeDumper, default_flow_style=False, indent=2,
+                          allow_unicode=True)
+        except Exception as e:
+            print(f"❌ Erreur lors de la sauvegarde des paramètres: {e}")
+            return
+        print(f"Paramètres sauvegardés: {filepath}")
     
     def load_parameters(self, filepath: str):
         """Charge les paramètres depuis un fichier YAML et les applique"""
-        if not os.path.exists(filepath):
+        # Scène déjà lue par _preload_scenes : pas d'accès disque
+        params = self._scene_cache.get(filepath)
+        if params is None and not os.path.exists(filepath):
             print(f"Fichier de paramètres non trouvé: {filepath}")
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                params = yaml.safe_load(f)
+            if params is None:
+                params = self._read_scene_file(filepath)
+            
+            # Current values, to regenerate only what the scene changes
+            old_grid = (self.dimension, self.cell_size)
+            old_canvas_size = tuple(self.canvas_size)
+            old_colors = (self.color_scheme, tuple(self.square_color))
+            old_shapes = (self.shape_type, self.mixed_shapes)
             
             # Apply core parameters
             self.dimension = params.get("dimension", self.dimension)
@@ -934,16 +1675,25 @@ class DeformedGrid:
             # Update base distortion strength
             self.base_distortion_strength = self.distortion_strength
             
-            # Recalculate offsets to center the grid with new dimensions
-            grid_total_size = self.dimension * self.cell_size
-            self.offset_x = (self.canvas_size[0] - grid_total_size) // 2
-            self.offset_y = (self.canvas_size[1] - grid_total_size) // 2
+            # A scene saved at another canvas size resizes the window
+            canvas_changed = self.canvas_size != old_canvas_size
+            if canvas_changed:
+                self._resize_window(self.canvas_size)
             
-            # Regenerate everything with new parameters
-            self._generate_base_positions()
-            self._generate_distortions()
-            self._generate_base_colors()
-            self._generate_shape_types()
+            # Regenerate only the per-cell data affected by the new parameters
+            # (the offsets follow dimension, cell_size and the window size)
+            grid_changed = (self.dimension, self.cell_size) != old_grid
+            if grid_changed or canvas_changed:
+                self._generate_base_positions()
+            if self.dimension != old_grid[0]:
+                self._generate_distortions()
+            if grid_changed or (self.color_scheme, tuple(self.square_color)) != old_colors:
+                self._generate_base_colors()
+            if self.dimension != old_grid[0] or (self.shape_type, self.mixed_shapes) != old_shapes:
+                self._generate_shape_types()
+            
+            # The background color may have changed: present the whole screen
+            self._full_update = True
             
             print(f"Paramètres chargés depuis: {filepath}")
             print(f"Scene: {params.get('distortion_fn', 'N/A')} | {params.get('color_scheme', 'N/A')} | {params.get('shape_type', 'N/A')}")
@@ -954,17 +1704,64 @@ class DeformedGrid:
             return False
     
     def get_saved_scenes(self) -> list:
-        """Retourne la liste des scènes sauvegardées (fichiers YAML)"""
+        """
+        Retourne la liste des scènes sauvegardées (fichiers YAML), y compris les
+        captures dont le YAML est encore en cours d'écriture.
+        """
+        pending = self._pending_scene_paths()
         if not os.path.exists("saved_params"):
-            return []
+            return pending
         
         yaml_files = glob.glob(os.path.join("saved_params", "*.yaml"))
+        yaml_files += [path for path in pending if path not in yaml_files]
         random.shuffle(yaml_files)
         return yaml_files
     
+    def _pending_scene_paths(self) -> list:
+        """Chemins des captures dont le YAML n'est pas encore écrit"""
+        for path, future in list(self._pending_scene_writes.items()):
+            if future.done():
+                del self._pending_scene_writes[path]
+        return list(self._pending_scene_writes)
+    
+    @staticmethod
+    def _read_scene_file(filepath: str) -> dict:
+        """Lit les paramètres d'une scène sauvegardée"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=SafeLoader)
+    
+    def _preload_scenes(self, scene_files: list):
+        """
+        Lit toutes les scènes en parallèle et garde leurs paramètres en mémoire.
+        
+        Les fichiers illisibles ne sont pas mis en cache : load_parameters les
+        relira et signalera l'erreur au moment de les charger. Les entrées déjà
+        en cache sont conservées, et les captures dont le YAML n'est pas encore
+        écrit ne sont pas relues : le fichier peut être absent ou incomplet.
+        """
+        def read_or_none(filepath):
+            try:
+                return self._read_scene_file(filepath)
+            except Exception:
+                return None
+        
+        pending = set(self._pending_scene_paths())
+        scene_files = [path for path in scene_files if path not in pending]
+        if not scene_files:
+            return
+        workers = min(self.SCENE_PRELOAD_WORKERS, len(scene_files))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scene-load") as pool:
+            preloaded = {
+                filepath: params
+                for filepath, params in zip(scene_files, pool.map(read_or_none, scene_files))
+                if isinstance(params, dict)
+            }
+        self._scene_cache.update(preloaded)
+    
     def initialize_scene_iteration(self):
         """Initialise l'itération des scènes sauvegardées"""
         self.saved_scenes = self.get_saved_scenes()
+        self._preload_scenes(self.saved_scenes)
         if self.saved_scenes:
             self.current_scene_index = 0
             self.scene_iteration_mode = True
@@ -1004,6 +1801,7 @@ class DeformedGrid:
     def refresh_saved_scenes(self):
         """Actualise la liste des scènes sauvegardées"""
         self.saved_scenes = self.get_saved_scenes()
+        self._preload_scenes(self.saved_scenes)
         if self.saved_scenes and self.current_scene_index >= len(self.saved_scenes):
             self.current_scene_index = 0
         print(f"🔄 Liste des scènes actualisée: {len(self.saved_scenes)} scène(s) trouvée(s)")
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Noyaux Numba pour les distorsions les plus courantes.
+
+Les noyaux calculent les positions déformées de toute la grille en une boucle
+compilée et parallélisée (prange). Numba est optionnel : si le module n'est pas
+installé, NUMBA_AVAILABLE vaut False et DistortionEngine utilise les versions
+NumPy de batch_distortions.
+"""
+
+import math
+
+import numpy as np
+
+from distorsion_movement.enums import DistortionType
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Remplaçant sans compilation lorsque Numba est absent."""
+        def decorator(function):
+            return function
+        return decorator
+
+    prange = range
+
+
+# Codes entiers des distorsions prises en charge par les noyaux compilés
+KERNEL_RANDOM = 0
+KERNEL_SINE = 1
+KERNEL_PERLIN = 2
+KERNEL_CIRCULAR = 3
+
+DISTORTION_KERNEL_CODES = {
+    DistortionType.RANDOM.value: KERNEL_RANDOM,
+    DistortionType.SINE.value: KERNEL_SINE,
+    DistortionType.PERLIN.value: KERNEL_PERLIN,
+    DistortionType.CIRCULAR.value: KERNEL_CIRCULAR,
+}
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_distortion_kernel(base_xy, offset_x, offset_y, phase_x, phase_y, frequency,
+                            rotation_phase, kernel_code, cell_size, strength, time,
+                            center_x, center_y, out):
+    """
+    Écrit dans out (N, 3) les (x, y, rotation) déformés de chaque cellule.
+
+    Le choix de la distorsion (kernel_code) est fait une seule fois, hors des
+    boucles parallèles sur les cellules.
+    """
+    n = base_xy.shape[0]
+    max_offset = cell_size * strength
+
+    if kernel_code == KERNEL_RANDOM:
+        for i in prange(n):
+            out[i, 0] = base_xy[i, 0] + offset_x[i] * max_offset
+            out[i, 1] = base_xy[i, 1] + offset_y[i] * max_offset
+            out[i, 2] = rotation_phase[i] * strength * 0.2
+
+    elif kernel_code == KERNEL_SINE:
+        for i in prange(n):
+            phase = time * frequency[i]
+            out[i, 0] = base_xy[i, 0] + math.sin(phase + phase_x[i]) * max_offset
+            out[i, 1] = base_xy[i, 1] + math.cos(phase + phase_y[i]) * max_offset
+            out[i, 2] = math.sin(time + rotation_phase[i]) * strength * 0.3
+
+    elif kernel_code == KERNEL_PERLIN:
+        for i in prange(n):
+            x = base_xy[i, 0]
+            y = base_xy[i, 1]
+            noise_x = math.sin(x * 0.01 + time) + math.sin(x * 0.03 + time * 0.5) * 0.5
+            noise_y = math.cos(y * 0.01 + time) + math.cos(y * 0.03 + time * 0.5) * 0.5
+            out[i, 0] = x + noise_x * max_offset * 0.5
+            out[i, 1] = y + noise_y * max_offset * 0.5
+            out[i, 2] = noise_x * strength * 0.2
+
+    elif kernel_code == KERNEL_CIRCULAR:
+        for i in prange(n):
+            x = base_xy[i, 0]
+            y = base_xy[i, 1]
+            dx = x - center_x
+            dy = y - center_y
+            distance = math.sqrt(dx * dx + dy * dy)
+            if distance == 0.0:
+                out[i, 0] = x
+                out[i, 1] = y
+                out[i, 2] = 0.0
+            else:
+                wave = math.sin(distance * 0.02 - time * 2) * strength
+                offset = cell_size * wave
+                out[i, 0] = x + (dx / distance) * offset
+                out[i, 1] = y + (dy / distance) * offset
+                out[i, 2] = wave * 0.5
+
+
+def warm_up():
+    """
+    Compile apply_distortion_kernel (ou le charge du cache disque) sur une
+    grille d'une cellule, pour que la première frame ne paie pas la compilation.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    base_xy = np.zeros((1, 2))
+    values = np.zeros(1)
+    out = np.empty((1, 3))
+    apply_distortion_kernel(base_xy, values, values, values, values, values, values,
+                            KERNEL_RANDOM, 1.0, 0.0, 0.0, 0.0, 0.0, out)
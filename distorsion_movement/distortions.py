@@ -4,9 +4,27 @@ Fonctions de distorsion géométrique pour les carrés de la grille.
 
 import math
 import random
-from typing import Tuple, List
+from typing import Tuple, List, Union
+
+import numpy as np
 
 from distorsion_movement.enums import DistortionType
+from distorsion_movement.batch_distortions import get_batch_distortion_function
+from distorsion_movement import distortion_kernels
+
+
+# Bornes des paramètres aléatoires de distorsion de chaque cellule
+DISTORTION_PARAM_RANGES = {
+    'offset_x': (-1, 1),
+    'offset_y': (-1, 1),
+    'phase_x': (0, 2 * math.pi),
+    'phase_y': (0, 2 * math.pi),
+    'frequency': (0.5, 2.0),
+    'rotation_phase': (0, 2 * math.pi),
+    'phase_offset': (0, 2 * math.pi),
+    'noise_ox': (0, 1000),
+    'noise_oy': (0, 1000),
+}
 
 
 class DistortionEngine:
@@ -23,14 +41,51 @@ class DistortionEngine:
             Dict contenant les paramètres de distorsion pour un carré
         """
         return {
-            'offset_x': random.uniform(-1, 1),
-            'offset_y': random.uniform(-1, 1),
-            'phase_x': random.uniform(0, 2 * math.pi),
-            'phase_y': random.uniform(0, 2 * math.pi),
-            'frequency': random.uniform(0.5, 2.0),
-            'rotation_phase': random.uniform(0, 2 * math.pi)
+            name: random.uniform(low, high)
+            for name, (low, high) in DISTORTION_PARAM_RANGES.items()
         }
     
+    @staticmethod
+    def generate_distortion_params_batch(count: int, rng: np.random.Generator = None) -> dict:
+        """
+        Génère les paramètres aléatoires de distorsion de toutes les cellules d'un coup.
+        
+        Args:
+            count: Nombre de cellules
+            rng: Générateur NumPy à utiliser (un nouveau par défaut)
+        
+        Returns:
+            Dict {nom du paramètre: ndarray de taille count} (structure de tableaux)
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        return {
+            name: rng.uniform(low, high, count)
+            for name, (low, high) in DISTORTION_PARAM_RANGES.items()
+        }
+    
+    @staticmethod
+    def params_to_batch(distortion_params: List[dict]) -> dict:
+        """
+        Convertit une liste de dicts de paramètres en structure de tableaux.
+        
+        Les paramètres absents sont tirés au hasard et mémorisés dans le dict
+        d'origine, pour rester stables d'une frame à l'autre.
+        
+        Args:
+            distortion_params: Liste des paramètres de distorsion par cellule
+        
+        Returns:
+            Dict {nom du paramètre: ndarray}
+        """
+        batch = {}
+        for name, (low, high) in DISTORTION_PARAM_RANGES.items():
+            batch[name] = np.array(
+                [params.setdefault(name, random.uniform(low, high)) for params in distortion_params],
+                dtype=np.float64
+            )
+        return batch
+    
     @staticmethod
     def apply_distortion_random(base_pos: Tuple[float, float], 
                                params: dict,
@@ -1138,6 +1193,7 @@ class DistortionEngine:
         x, y = base_pos
         cx, cy = canvas_size[0] * 0.5, canvas_size[1] * 0.5
 
+        # Defaults, overridden by the per-cell params (e.g. stable noise offsets)
         params = {
             "sectors": 10,          # try 8–14
             "spin_speed": 0.10,     # slower = more regal
@@ -1145,7 +1201,8 @@ class DistortionEngine:
             "melt_amount": 0.35,    # subtle melt
             "noise_scale": 0.02,
             "noise_speed": 0.35,
-            "max_disp_frac": 0.34
+            "max_disp_frac": 0.34,
+            **params
         }
 
         # ---------- Controls (tweak in params) ----------
@@ -1364,121 +1421,143 @@ class DistortionEngine:
 
         
     @staticmethod
-    def get_distorted_positions(base_positions: List[Tuple[float, float]],
-                               distortion_params: List[dict],
+    def _get_distorted_positions_per_cell(base_positions,
+                                          distortion_params: List[dict],
+                                          distortion_fn: str,
+                                          cell_size: int,
+                                          distortion_strength: float,
+                                          time: float,
+                                          canvas_size: Tuple[int, int]) -> List[Tuple[float, float, float]]:
+        """
+        Calcule les positions déformées cellule par cellule avec les fonctions scalaires.
+        Utilisé lorsque des paramètres par cellule personnalisés (axis, diag_variant,
+        lens_radius_cells, ...) ne sont pas pris en charge par les versions vectorisées.
+        """
+        distort = DistortionEngine._scalar_distortion_function(
+            distortion_fn, cell_size, distortion_strength, time, canvas_size
+        )
+        return [distort(base_pos, params)
+                for base_pos, params in zip(base_positions, distortion_params)]
+    
+    @staticmethod
+    def _scalar_distortion_function(distortion_fn: str,
+                                    cell_size: int,
+                                    distortion_strength: float,
+                                    time: float,
+                                    canvas_size: Tuple[int, int]):
+        """
+        Retourne la fonction scalaire de distorsion_fn, liée aux paramètres de la
+        frame : choisie une seule fois pour toute la grille, appelée avec
+        (base_pos, params) pour chaque cellule. Les types inconnus retombent sur
+        la distorsion aléatoire.
+        """
+        engine = DistortionEngine
+        # Fonctions qui prennent (time) ou (time, canvas_size) après l'intensité
+        with_time = {
+            DistortionType.SINE.value: engine.apply_distortion_sine,
+            DistortionType.PERLIN.value: engine.apply_distortion_perlin,
+            DistortionType.FLOW.value: engine.apply_distortion_flow,
+            DistortionType.CHECKERBOARD.value: engine.apply_distortion_checkerboard,
+            DistortionType.CHECKERBOARD_DIAGONAL.value: engine.apply_distortion_checkerboard_diagonal,
+            DistortionType.SHEAR.value: engine.apply_distortion_shear,
+            DistortionType.NOISE_ROTATION.value: engine.apply_distortion_noise_rotation,
+            DistortionType.CURL_WARP.value: engine.apply_distortion_curl_warp,
+            DistortionType.FRACTAL_NOISE.value: engine.apply_distortion_fractal_noise,
+        }
+        with_time_and_canvas = {
+            DistortionType.CIRCULAR.value: engine.apply_distortion_circular,
+            DistortionType.SWIRL.value: engine.apply_distortion_swirl,
+            DistortionType.RIPPLE.value: engine.apply_distortion_ripple,
+            DistortionType.PULSE.value: engine.apply_distortion_pulse,
+            DistortionType.TORNADO.value: engine.apply_distortion_tornado,
+            DistortionType.SPIRAL.value: engine.apply_distortion_spiral,
+            DistortionType.LENS.value: engine.apply_distortion_lens,
+            DistortionType.SPIRAL_WAVE.value: engine.apply_distortion_spiral_wave,
+            DistortionType.MOIRE.value: engine.apply_distortion_moire,
+            DistortionType.KALEIDOSCOPE_TWIST.value: engine.apply_distortion_kaleidoscope_twist,
+            DistortionType.HYPNO_SPIRAL_PULSE.value: engine.apply_distortion_hypno_spiral_pulse,
+        }
+        
+        if distortion_fn in with_time:
+            function = with_time[distortion_fn]
+            return lambda base_pos, params: function(
+                base_pos, params, cell_size, distortion_strength, time
+            )
+        if distortion_fn in with_time_and_canvas:
+            function = with_time_and_canvas[distortion_fn]
+            return lambda base_pos, params: function(
+                base_pos, params, cell_size, distortion_strength, time, canvas_size
+            )
+        return lambda base_pos, params: engine.apply_distortion_random(
+            base_pos, params, cell_size, distortion_strength
+        )
+    
+    @staticmethod
+    def get_distorted_positions(base_positions,
+                               distortion_params: Union[dict, List[dict]],
                                distortion_fn: str,
                                cell_size: int,
                                distortion_strength: float,
                                time: float,
-                               canvas_size: Tuple[int, int]) -> List[Tuple[float, float, float]]:
+                               canvas_size: Tuple[int, int],
+                               out: np.ndarray = None) -> np.ndarray:
         """
         Calcule toutes les positions déformées selon la fonction choisie.
         
+        Le calcul est vectorisé sur toute la grille : noyau Numba compilé pour les
+        distorsions qui en ont un (voir distortion_kernels), NumPy sinon
+        (voir batch_distortions).
+        
         Args:
-            base_positions: Liste des positions de base
-            distortion_params: Liste des paramètres de distorsion
+            base_positions: Positions de base, séquence de (x, y) ou ndarray (N, 2)
+            distortion_params: Paramètres de distorsion, soit en structure de tableaux
+                (voir generate_distortion_params_batch), soit en liste de dicts
             distortion_fn: Type de fonction de distorsion
             cell_size: Taille des cellules
             distortion_strength: Intensité de distorsion
             time: Temps actuel pour l'animation
             canvas_size: Taille du canvas
+            out: ndarray (N, 3) float64 réutilisé pour le résultat (alloué si None
+                ou de forme différente)
         
         Returns:
-            Liste de tuples (x, y, rotation) pour chaque carré
+            ndarray (N, 3) des (x, y, rotation) de chaque carré
         """
-        positions = []
-        
-        for i, (base_pos, params) in enumerate(zip(base_positions, distortion_params)):
-            if distortion_fn == DistortionType.RANDOM.value:
-                pos = DistortionEngine.apply_distortion_random(
-                    base_pos, params, cell_size, distortion_strength
-                )
-            elif distortion_fn == DistortionType.SINE.value:
-                pos = DistortionEngine.apply_distortion_sine(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.PERLIN.value:
-                pos = DistortionEngine.apply_distortion_perlin(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.CIRCULAR.value:
-                pos = DistortionEngine.apply_distortion_circular(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.SWIRL.value:
-                pos = DistortionEngine.apply_distortion_swirl(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.RIPPLE.value:
-                pos = DistortionEngine.apply_distortion_ripple(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.FLOW.value:
-                pos = DistortionEngine.apply_distortion_flow(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.PULSE.value:
-                pos = DistortionEngine.apply_distortion_pulse(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.CHECKERBOARD.value:
-                pos = DistortionEngine.apply_distortion_checkerboard(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.CHECKERBOARD_DIAGONAL.value:
-                pos = DistortionEngine.apply_distortion_checkerboard_diagonal(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.TORNADO.value:
-                pos = DistortionEngine.apply_distortion_tornado(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.SPIRAL.value:
-                pos = DistortionEngine.apply_distortion_spiral(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.SHEAR.value:
-                pos = DistortionEngine.apply_distortion_shear(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.LENS.value:
-                pos = DistortionEngine.apply_distortion_lens(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.SPIRAL_WAVE.value:
-                pos = DistortionEngine.apply_distortion_spiral_wave(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.NOISE_ROTATION.value:
-                pos = DistortionEngine.apply_distortion_noise_rotation(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.CURL_WARP.value:
-                pos = DistortionEngine.apply_distortion_curl_warp(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.FRACTAL_NOISE.value:
-                pos = DistortionEngine.apply_distortion_fractal_noise(
-                    base_pos, params, cell_size, distortion_strength, time
-                )
-            elif distortion_fn == DistortionType.MOIRE.value:
-                pos = DistortionEngine.apply_distortion_moire(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.KALEIDOSCOPE_TWIST.value:
-                pos = DistortionEngine.apply_distortion_kaleidoscope_twist(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            elif distortion_fn == DistortionType.HYPNO_SPIRAL_PULSE.value:
-                pos = DistortionEngine.apply_distortion_hypno_spiral_pulse(
-                    base_pos, params, cell_size, distortion_strength, time, canvas_size
-                )
-            else:
-                pos = DistortionEngine.apply_distortion_random(
-                    base_pos, params, cell_size, distortion_strength
-                )
-
-            
-            positions.append(pos)
+        base = np.asarray(base_positions, dtype=np.float64).reshape(-1, 2)
+        if out is None or out.shape != (len(base), 3) or out.dtype != np.float64:
+            out = np.empty((len(base), 3), dtype=np.float64)
+        
+        if not isinstance(distortion_params, dict):
+            # Les paramètres personnalisés par cellule ne sont gérés que par les fonctions scalaires
+            if any(name not in DISTORTION_PARAM_RANGES
+                   for params in distortion_params for name in params):
+                out[...] = np.array(DistortionEngine._get_distorted_positions_per_cell(
+                    base.tolist(), distortion_params, distortion_fn, cell_size,
+                    distortion_strength, time, canvas_size
+                ), dtype=np.float64).reshape(-1, 3)
+                return out
+            distortion_params = DistortionEngine.params_to_batch(distortion_params)
+        
+        kernel_code = distortion_kernels.DISTORTION_KERNEL_CODES.get(distortion_fn)
+        if distortion_kernels.NUMBA_AVAILABLE and kernel_code is not None:
+            distortion_kernels.apply_distortion_kernel(
+                base,
+                distortion_params['offset_x'], distortion_params['offset_y'],
+                distortion_params['phase_x'], distortion_params['phase_y'],
+                distortion_params['frequency'], distortion_params['rotation_phase'],
+                kernel_code, float(cell_size), float(distortion_strength), float(time),
+                float(canvas_size[0] // 2), float(canvas_size[1] // 2),
+                out
+            )
+            return out
+        
+        distortion_function = get_batch_distortion_function(distortion_fn)
+        new_x, new_y, rotation = distortion_function(
+            base[:, 0], base[:, 1], distortion_params,
+            cell_size, distortion_strength, time, canvas_size
+        )
         
-        return positions
\ No newline at end of file
+        out[:, 0] = new_x
+        out[:, 1] = new_y
+        out[:, 2] = rotation
+        return out
@@ -0,0 +1,42 @@
+"""
+Noyau Numba pour la réduction des frames du GIF.
+
+Le thread d'écriture du GIF réduit chaque frame capturée avant de la
+convertir en couleurs indexées. Le noyau est compilé avec nogil=True : il
+s'exécute sans le GIL, en parallèle de la boucle de rendu. Numba est
+optionnel : si le module n'est pas installé, NUMBA_AVAILABLE vaut False et
+DeformedGrid utilise une version NumPy équivalente.
+"""
+
+import numpy as np
+
+from distorsion_movement.distortion_kernels import NUMBA_AVAILABLE, njit
+
+
+@njit(nogil=True, cache=True)
+def downscale_frame(frame, factor, out):
+    """
+    Écrit dans out (height // factor, width // factor, 3) uint8 la moyenne
+    arrondie de chaque bloc factor×factor de frame (height, width, 3) uint8.
+    """
+    half = (factor * factor) // 2
+    area = factor * factor
+    for row in range(out.shape[0]):
+        for col in range(out.shape[1]):
+            for channel in range(3):
+                total = half
+                for dy in range(factor):
+                    for dx in range(factor):
+                        total += frame[row * factor + dy, col * factor + dx, channel]
+                out[row, col, channel] = total // area
+
+
+def warm_up():
+    """
+    Compile downscale_frame (ou le charge du cache disque) en réduisant une
+    frame de 2×2 pixels à un pixel, pour que le thread d'écriture ne paie pas
+    la compilation.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    downscale_frame(np.zeros((2, 2, 3), dtype=np.uint8), 2, np.empty((1, 1, 3), dtype=np.uint8))
@@ -18,6 +18,7 @@ from .ring import Ring
 from .yin_yang import YinYang
 from .leaf import Leaf
 from .ellipsis import Ellipsis
+from .sprite_cache import ShapeSpriteCache
 
 # Registre des formes disponibles
 SHAPE_REGISTRY = {
@@ -54,5 +55,6 @@ __all__ = [
     'Star', 'Diamond', 'KochSnowflake', 'Ring', 'YinYang', 'Leaf',
     'Ellipsis',
     'get_shape_renderer_function',
-    'SHAPE_REGISTRY'
+    'SHAPE_REGISTRY',
+    'ShapeSpriteCache'
 ]
\ No newline at end of file
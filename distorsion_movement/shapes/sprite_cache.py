@@ -0,0 +1,97 @@
+"""
+Cache de sprites pré-rendus pour les formes.
+
+Chaque sprite est une forme déjà dessinée (couleur, angle) sur une petite
+surface transparente. Le rendu de la grille peut alors envoyer toutes les
+cellules à pygame en un seul appel Surface.blits() au lieu d'un appel de
+dessin Python par cellule.
+"""
+
+import math
+import numpy as np
+import pygame
+from typing import Callable, Optional, Tuple
+
+
+class ShapeSpriteCache:
+    """Sprites indexés par (forme, couleur, angle discrétisé) pour une taille donnée."""
+
+    # Nombre d'angles pré-rendus sur un tour complet
+    ROTATION_BINS = 32
+
+    def __init__(self, size: int, max_entries: int = 4096):
+        """
+        Args:
+            size: Taille des formes (cell_size de la grille)
+            max_entries: Nombre maximal de sprites conservés
+        """
+        self.size = size
+        self.max_entries = max_entries
+        self._sprites = {}
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def clear(self):
+        """Vide le cache (changement de taille ou de couleurs)."""
+        self._sprites.clear()
+
+    @classmethod
+    def rotation_bin(cls, rotation: float) -> int:
+        """Retourne l'indice de l'angle pré-rendu le plus proche de rotation (radians)."""
+        return round(rotation * (cls.ROTATION_BINS / (2 * math.pi))) % cls.ROTATION_BINS
+
+    @classmethod
+    def rotation_bins(cls, rotations: np.ndarray) -> np.ndarray:
+        """
+        Version vectorisée de rotation_bin pour toute la grille.
+
+        Les angles non finis (NaN, infini) sont ramenés à l'indice 0.
+        """
+        scaled = np.nan_to_num(rotations, nan=0.0, posinf=0.0, neginf=0.0)
+        scaled = np.rint(scaled * (cls.ROTATION_BINS / (2 * math.pi)))
+        return scaled.astype(np.int64) % cls.ROTATION_BINS
+
+    @classmethod
+    def bin_rotation(cls, rotation_bin: int) -> float:
+        """Retourne l'angle (radians) pré-rendu pour l'indice rotation_bin."""
+        return rotation_bin * 2 * math.pi / cls.ROTATION_BINS
+
+    def get(self, shape_id: int, draw_function: Callable, color: Tuple[int, int, int],
+            rotation_bin: int) -> Optional[Tuple[pygame.Surface, int, int]]:
+        """
+        Retourne le sprite d'une forme et son décalage par rapport au centre.
+
+        Args:
+            shape_id: Code entier de la forme
+            draw_function: Fonction de rendu de la forme (utilisée au premier appel)
+            color: Couleur RGB de la forme
+            rotation_bin: Indice d'angle retourné par rotation_bin()
+
+        Returns:
+            (surface, dx, dy) à blitter en (x + dx, y + dy), ou None si le cache
+            est plein et que ce sprite n'y figure pas encore
+        """
+        key = (shape_id, color, rotation_bin)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            if len(self._sprites) >= self.max_entries:
+                return None
+            sprite = self._render_sprite(draw_function, color, rotation_bin)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _render_sprite(self, draw_function: Callable, color: Tuple[int, int, int],
+                       rotation_bin: int) -> Tuple[pygame.Surface, int, int]:
+        """Dessine la forme sur une surface transparente rognée à son contenu."""
+        side = self.size * 2 + 4
+        center = side // 2
+        canvas = pygame.Surface((side, side), pygame.SRCALPHA)
+        draw_function(canvas, center, center, self.bin_rotation(rotation_bin), self.size, color)
+
+        bounds = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(bounds).copy()
+        if pygame.display.get_surface() is not None:
+            # Format de pixels de l'écran : évite une conversion à chaque blit
+            sprite = sprite.convert_alpha()
+        return sprite, bounds.x - center, bounds.y - center
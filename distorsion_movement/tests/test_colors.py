@@ -4,8 +4,13 @@ Unit tests for colors module.
 
 import pytest
 import math
-from distorsion_movement.colors import ColorGenerator
+import numpy as np
+from unittest.mock import patch
+from distorsion_movement.colors import (
+    ColorGenerator, COLOR_SCHEME_REGISTRY, COLOR_SCHEME_BATCH_REGISTRY
+)
 from distorsion_movement.enums import ColorScheme
+from distorsion_movement.colors.base_color import BaseColor
 
 
 class TestColorGenerator:
@@ -208,4 +213,82 @@ class TestColorGenerator:
         r, g, b = color
         assert 0 <= r <= 255
         assert 0 <= g <= 255
-        assert 0 <= b <= 255
\ No newline at end of file
+        assert 0 <= b <= 255
+    
+    def test_get_grid_colors(self):
+        """Test whole-grid color generation and its cache."""
+        dimension = 5
+        colors = ColorGenerator.get_grid_colors(ColorScheme.RAINBOW.value, (255, 255, 255), dimension)
+
+        assert colors.shape == (dimension * dimension, 3)
+        assert colors.dtype == np.uint8
+        assert not colors.flags.writeable
+
+        # Matches the per-position function
+        for index in (0, 7, 24):
+            row, col = divmod(index, dimension)
+            x_norm = col / (dimension - 1)
+            y_norm = row / (dimension - 1)
+            distance = min(math.sqrt((x_norm - 0.5)**2 + (y_norm - 0.5)**2) / 0.707, 1.0)
+            expected = ColorGenerator.get_color_for_position(
+                ColorScheme.RAINBOW.value, (255, 255, 255), x_norm, y_norm, distance, index, dimension
+            )
+            assert tuple(colors[index].tolist()) == expected
+
+        # Same arguments hit the cache
+        assert ColorGenerator.get_grid_colors(ColorScheme.RAINBOW.value, (255, 255, 255), dimension) is colors
+
+    @pytest.mark.parametrize("color_scheme", list(COLOR_SCHEME_REGISTRY))
+    def test_batch_colors_match_per_position(self, color_scheme):
+        """Test that each scheme's vectorized colors match its per-position function."""
+        rng = np.random.default_rng(7)
+        count = 200
+        x_norms = np.concatenate([[0.0, 1.0, 0.5, 0.5], rng.uniform(0, 1, count - 4)])
+        y_norms = np.concatenate([[0.0, 1.0, 0.5, 0.0], rng.uniform(0, 1, count - 4)])
+        distances = np.concatenate([[1.0, 1.0, 0.0, 0.3], rng.uniform(0, 1, count - 4)])
+        indices = np.arange(count)
+        square_color = (120, 40, 220)
+
+        colors = COLOR_SCHEME_BATCH_REGISTRY[color_scheme](
+            square_color, x_norms, y_norms, distances, indices, 15
+        )
+        assert colors.shape == (count, 3)
+        assert colors.dtype == np.uint8
+        scalar_function = COLOR_SCHEME_REGISTRY[color_scheme]
+        for i in range(count):
+            expected = scalar_function(
+                square_color, float(x_norms[i]), float(y_norms[i]), float(distances[i]), i, 15
+            )
+            assert tuple(colors[i].tolist()) == tuple(expected)
+
+    @pytest.mark.parametrize("color_scheme", list(COLOR_SCHEME_REGISTRY))
+    def test_batch_colors_are_vectorized(self, color_scheme):
+        """Test that no scheme falls back to the per-position loop of BaseColor."""
+        batch_function = COLOR_SCHEME_BATCH_REGISTRY[color_scheme]
+        assert getattr(batch_function, "__func__", batch_function) is not BaseColor.get_colors_for_positions.__func__
+
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_get_animated_colors_matches_per_cell(self, numba_available):
+        """Test that whole-grid color animation matches get_animated_color, with or without Numba."""
+        base_colors = ColorGenerator.get_grid_colors(ColorScheme.RAINBOW.value, (255, 255, 255), 8)
+        out = np.empty_like(base_colors)
+
+        with patch('distorsion_movement.color_kernels.NUMBA_AVAILABLE', numba_available):
+            for time in (0.0, 0.37, 12.5):
+                animated = ColorGenerator.get_animated_colors(base_colors, time, out=out)
+                assert animated is out
+                for index, base_color in enumerate(base_colors.tolist()):
+                    expected = ColorGenerator.get_animated_color(tuple(base_color), index, time, True)
+                    assert tuple(animated[index].tolist()) == expected
+
+    def test_quantize_colors(self):
+        """Test that quantized channels land on the center of their bucket."""
+        colors = np.array([[0, 15, 16], [128, 200, 255]], dtype=np.uint8)
+
+        quantized = ColorGenerator.quantize_colors(colors, 4)
+        assert quantized.tolist() == [[8, 8, 24], [136, 200, 248]]
+        assert colors.tolist() == [[0, 15, 16], [128, 200, 255]]
+
+        # In place, and 8 bits keeps colors unchanged
+        assert ColorGenerator.quantize_colors(colors, 8, out=colors) is colors
+        assert colors.tolist() == [[0, 15, 16], [128, 200, 255]]
@@ -4,6 +4,7 @@ Unit tests for distortions module.
 
 import pytest
 import math
+import numpy as np
 from unittest.mock import patch
 from distorsion_movement.distortions import DistortionEngine
 from distorsion_movement.enums import DistortionType
@@ -819,4 +820,114 @@ class TestDistortionEngine:
             # Check values are finite
             assert math.isfinite(x)
             assert math.isfinite(y)
-            assert math.isfinite(rotation)
\ No newline at end of file
+            assert math.isfinite(rotation)
+    
+    def test_generate_distortion_params_batch(self):
+        """Test batched (structure of arrays) parameter generation."""
+        params = DistortionEngine.generate_distortion_params_batch(50)
+
+        required_keys = ['offset_x', 'offset_y', 'phase_x', 'phase_y', 'frequency',
+                         'rotation_phase', 'phase_offset', 'noise_ox', 'noise_oy']
+        assert all(key in params for key in required_keys)
+        for key in required_keys:
+            assert params[key].shape == (50,)
+
+        assert np.all((-1 <= params['offset_x']) & (params['offset_x'] <= 1))
+        assert np.all((0.5 <= params['frequency']) & (params['frequency'] <= 2.0))
+        assert np.all((0 <= params['phase_offset']) & (params['phase_offset'] <= 2 * math.pi))
+
+    @pytest.mark.parametrize("distortion_type", list(DistortionType))
+    @pytest.mark.parametrize("time", [0.0, 0.37, 2.5])
+    def test_vectorized_positions_match_scalar(self, distortion_type, time):
+        """Test that the vectorized distortions match the per-cell functions."""
+        canvas_size = (300, 240)
+        cell_size = 12
+        distortion_strength = 0.8
+        # Includes the exact canvas center to exercise the singularity handling
+        base_positions = [(150.0, 120.0), (150, 120)] + [
+            (x * 13.0 + 3, y * 11.0 + 5) for x in range(6) for y in range(5)
+        ]
+        params = DistortionEngine.generate_distortion_params_batch(
+            len(base_positions), np.random.default_rng(1234)
+        )
+        params_list = [
+            {name: float(values[i]) for name, values in params.items()}
+            for i in range(len(base_positions))
+        ]
+
+        vectorized = DistortionEngine.get_distorted_positions(
+            base_positions, params, distortion_type.value,
+            cell_size, distortion_strength, time, canvas_size
+        )
+        scalar = DistortionEngine._get_distorted_positions_per_cell(
+            base_positions, params_list, distortion_type.value,
+            cell_size, distortion_strength, time, canvas_size
+        )
+
+        assert vectorized.shape == (len(base_positions), 3)
+        np.testing.assert_allclose(vectorized, np.array(scalar, dtype=float), rtol=1e-9, atol=1e-9)
+
+    def test_get_distorted_positions_custom_params_use_scalar_path(self):
+        """Test that per-cell overrides unknown to the vectorized path are honoured."""
+        base_positions = [(100.0, 100.0), (150.0, 120.0)]
+        distortion_params = [
+            dict(DistortionEngine.generate_distortion_params(), axis="vertical")
+            for _ in range(len(base_positions))
+        ]
+
+        positions = DistortionEngine.get_distorted_positions(
+            base_positions, distortion_params, DistortionType.SHEAR.value,
+            10, 0.5, 0.3, (400, 300)
+        )
+
+        # Vertical shear only moves cells along y
+        assert positions.shape == (2, 3)
+        assert positions[0, 0] == 100.0
+        assert positions[1, 0] == 150.0
+
+    @pytest.mark.parametrize("distortion_type", [
+        DistortionType.RANDOM,
+        DistortionType.SINE,
+        DistortionType.PERLIN,
+        DistortionType.CIRCULAR,
+    ])
+    def test_numpy_fallback_matches_compiled_kernels(self, distortion_type):
+        """Test that the NumPy path gives the same positions as the Numba kernels."""
+        base_positions = [(200.0, 150.0)] + [(x * 17.0, y * 9.0) for x in range(8) for y in range(8)]
+        params = DistortionEngine.generate_distortion_params_batch(len(base_positions))
+        args = (base_positions, params, distortion_type.value, 14, 0.6, 1.7, (400, 300))
+
+        kernel_positions = DistortionEngine.get_distorted_positions(*args)
+        with patch('distorsion_movement.distortion_kernels.NUMBA_AVAILABLE', False):
+            numpy_positions = DistortionEngine.get_distorted_positions(*args)
+
+        np.testing.assert_allclose(kernel_positions, numpy_positions, rtol=1e-9, atol=1e-9)
+
+    @pytest.mark.parametrize("distortion_type", [DistortionType.SINE, DistortionType.SWIRL])
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_out_buffer_is_reused(self, distortion_type, numba_available):
+        """Test that a matching output buffer is filled in place instead of reallocated."""
+        base_positions = np.array([(x * 17.0, y * 9.0) for x in range(4) for y in range(4)])
+        params = DistortionEngine.generate_distortion_params_batch(len(base_positions))
+        args = (base_positions, params, distortion_type.value, 14, 0.6, 1.7, (400, 300))
+
+        with patch('distorsion_movement.distortion_kernels.NUMBA_AVAILABLE', numba_available):
+            expected = DistortionEngine.get_distorted_positions(*args)
+            out = np.empty((len(base_positions), 3))
+            assert DistortionEngine.get_distorted_positions(*args, out=out) is out
+            np.testing.assert_array_equal(out, expected)
+
+            # A buffer of the wrong size is replaced
+            wrong = np.empty((3, 3))
+            assert DistortionEngine.get_distorted_positions(*args, out=wrong) is not wrong
+
+    @pytest.mark.parametrize("numba_available", [True, False])
+    def test_kernel_warm_up(self, numba_available):
+        """Test that kernel warm-up runs with and without Numba."""
+        from distorsion_movement import distortion_kernels, color_kernels, frame_kernels
+        with patch('distorsion_movement.distortion_kernels.NUMBA_AVAILABLE', numba_available), \
+             patch('distorsion_movement.color_kernels.NUMBA_AVAILABLE', numba_available), \
+             patch('distorsion_movement.frame_kernels.NUMBA_AVAILABLE', numba_available):
+            distortion_kernels.warm_up()
+            color_kernels.warm_up()
+            frame_kernels.warm_up()
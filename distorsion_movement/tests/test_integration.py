@@ -209,7 +209,7 @@ class TestPackageIntegration:
         
         # Number of colors should match positions
         assert len(grid.base_colors) == len(grid.base_positions)
-        assert len(grid.distortions) == len(grid.base_positions)
+        assert len(grid.distortions['offset_x']) == len(grid.base_positions)
         assert len(grid.base_positions) == 25  # 5x5
         
         # Colors should be deterministic for same parameters
@@ -9,7 +9,8 @@ from unittest.mock import Mock, patch, MagicMock
 
 from distorsion_movement.shapes import (
     get_shape_renderer_function, 
-    BaseShape, Square, Circle, Triangle, Hexagon, Pentagon, Star, Diamond, KochSnowflake, Ring
+    BaseShape, Square, Circle, Triangle, Hexagon, Pentagon, Star, Diamond, KochSnowflake, Ring,
+    ShapeSpriteCache
 )
 
 
@@ -301,4 +302,65 @@ class TestShapeIntegration:
                     func(mock_surface, x, y, rotation, size, color)
                 except Exception as e:
                     pytest.fail(f"Paramètres ({x}, {y}, {rotation}, {size}, {color}) "
-                              f"ont causé une erreur pour {shape_type}: {e}")
\ No newline at end of file
+                              f"ont causé une erreur pour {shape_type}: {e}")
+
+
+class TestShapeSpriteCache:
+    """Tests pour le cache de sprites pré-rendus."""
+    
+    def test_rotation_bin_wraps(self):
+        """Test que les angles sont ramenés à l'indice le plus proche sur un tour."""
+        assert ShapeSpriteCache.rotation_bin(0.0) == 0
+        assert ShapeSpriteCache.rotation_bin(2 * math.pi) == 0
+        assert ShapeSpriteCache.rotation_bin(-2 * math.pi / ShapeSpriteCache.ROTATION_BINS) == \
+            ShapeSpriteCache.ROTATION_BINS - 1
+    
+    def test_rotation_bins_matches_scalar(self):
+        """Test que la version vectorisée donne les mêmes indices que rotation_bin."""
+        import numpy as np
+        rotations = np.array([0.0, 0.1, -0.3, 3.0, 7.5, -12.0, float('nan'), float('inf')])
+        bins = ShapeSpriteCache.rotation_bins(rotations)
+        expected = [ShapeSpriteCache.rotation_bin(r) for r in rotations[:6]] + [0, 0]
+        assert bins.tolist() == expected
+    
+    def test_sprite_matches_direct_draw(self):
+        """Test qu'un sprite blitté reproduit le dessin direct de la forme."""
+        cache = ShapeSpriteCache(20)
+        surface, dx, dy = cache.get(0, Square.draw, (200, 50, 50), 0)
+        
+        blitted = pygame.Surface((100, 100))
+        blitted.blit(surface, (50 + dx, 50 + dy))
+        drawn = pygame.Surface((100, 100))
+        Square.draw(drawn, 50, 50, 0.0, 20, (200, 50, 50))
+        
+        assert surface.get_size() == (21, 21)
+        assert pygame.image.tobytes(blitted, "RGB") == pygame.image.tobytes(drawn, "RGB")
+    
+    def test_sprites_are_reused_and_bounded(self):
+        """Test que les sprites sont réutilisés et que le cache ne dépasse pas sa limite."""
+        cache = ShapeSpriteCache(10, max_entries=2)
+        first = cache.get(0, Square.draw, (255, 0, 0), 0)
+        assert cache.get(0, Square.draw, (255, 0, 0), 0) is first
+        cache.get(0, Square.draw, (0, 255, 0), 0)
+        assert len(cache) == 2
+        assert cache.get(0, Square.draw, (0, 0, 255), 0) is None
+        
+        cache.clear()
+        assert len(cache) == 0
+    
+    def test_sprites_use_display_format_when_display_is_set(self, monkeypatch):
+        """Test que les sprites sont convertis au format de l'écran s'il existe."""
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        try:
+            screen = pygame.display.set_mode((50, 50))
+            cache = ShapeSpriteCache(10)
+            surface, dx, dy = cache.get(0, Square.draw, (200, 50, 50), 0)
+            
+            assert surface.get_bitsize() == 32
+            assert surface.get_flags() & pygame.SRCALPHA
+            screen.fill((0, 0, 0))
+            screen.blit(surface, (25 + dx, 25 + dy))
+            assert screen.get_at((25, 25))[:3] == (200, 50, 50)
+        finally:
+            pygame.display.quit()